@@ -14,8 +14,16 @@ Game Rules:
 """
 
 import asyncio
+import hashlib
+import json
 import os
+import re
 import sys
+from pathlib import Path
+
+import httpx
+import litellm
+from mcp.types import Tool as MCPTool
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -63,6 +71,44 @@ bob_card = AgentCard(
     ],
 )
 
+# Phrases that signal the game has ended
+_GAME_OVER_RE = re.compile(r"game over|congratulations", re.IGNORECASE)
+
+# On-disk tool catalog cache, keyed by MCP address and the bus's advertised tools
+TOOLS_CACHE_DIR = Path(
+    os.getenv(
+        "THRONGLETS_MCP_TOOLS_CACHE_DIR",
+        Path.home() / ".cache" / "thronglets" / "mcp_tools",
+    )
+)
+
+
+async def warm_tools_cache(
+    server: MCPServerStreamableHttp, mcp_url: str, bus_tools: list[dict]
+) -> None:
+    """Seed the server's tool list from disk, or discover it once and persist it.
+
+    The cache key hashes the tool list from ``/system/info``, so any change
+    to the bus's tools invalidates the cached catalog.
+    """
+    tools_digest = json.dumps(bus_tools, sort_keys=True)
+    key = hashlib.sha256(f"{mcp_url}|{tools_digest}".encode()).hexdigest()
+    cache_file = TOOLS_CACHE_DIR / f"{key}.json"
+
+    if cache_file.exists():
+        try:
+            cached = json.loads(cache_file.read_text())
+            server._tools_list = [MCPTool.model_validate(tool) for tool in cached]
+            server._cache_dirty = False
+            return
+        except (OSError, ValueError):
+            cache_file.unlink(missing_ok=True)
+
+    tools = await server.list_tools()
+    TOOLS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps([tool.model_dump(mode="json") for tool in tools]))
+
+
 model = LitellmModel(
     model=os.getenv("OPENAI_MODEL"),
     api_key=os.getenv("OPENAI_API_KEY"),
@@ -79,10 +125,25 @@ async def main():
     servicebus_url = os.getenv("THRONGLETS_SERVICEBUS_URL", "http://bus:8000")
     print(f"🔗 Connecting to ServiceBus: {servicebus_url}")
 
+    # Alice and Bob share one model, so give LiteLLM one pooled client for both
+    llm_http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+    )
+    litellm.aclient_session = llm_http_client
+
+    try:
+        await run_game(servicebus_url, llm_http_client)
+    finally:
+        litellm.aclient_session = None
+        await llm_http_client.aclose()
+
+
+async def run_game(servicebus_url: str, http: httpx.AsyncClient):
+    """Register both agents on the bus and play the game until it ends."""
     # Create two BusClient connections
     async with Bus(url=servicebus_url, agent_card=alice_card) as alice_client:
         async with Bus(url=servicebus_url, agent_card=bob_card) as bob_client:
-
             print(f"📝 Alice registered with ID: {alice_client.agent_id}")
             print(f"📝 Bob registered with ID: {bob_client.agent_id}")
             print(f"🔗 MCP Address: {alice_client.mcp_address}")
@@ -109,8 +170,12 @@ async def main():
                     cache_tools_list=True,
                 ) as bob_mcp,
             ):
-
                 print("🔌 MCP connections established")
+
+                info = await http.get(f"{servicebus_url}/system/info")
+                bus_tools = info.json().get("mcp", {}).get("tools", [])
+                for server in (alice_mcp, bob_mcp):
+                    await warm_tools_cache(server, alice_client.mcp_address, bus_tools)
                 print()
 
                 # Define Alice - Game Host
@@ -152,9 +217,12 @@ Always use the available MCP tools to interact with other agents. Be friendly an
                 # Shared event to coordinate game ending
                 game_over_event = asyncio.Event()
 
+                # Games are transient: keep history in memory, dump it once at the end
+                alice_session = SQLiteSession(session_id="alice", db_path=":memory:")
+                bob_session = SQLiteSession(session_id="bob", db_path=":memory:")
+
                 # Run Alice with continuous loop
                 async def run_alice_continuous():
-                    session = SQLiteSession(session_id="alice")
                     input_text = "Start a guessing game with another agent!"
 
                     for turn in range(30):  # Max 30 turns
@@ -166,16 +234,13 @@ Always use the available MCP tools to interact with other agents. Be friendly an
                             result = await Runner.run(
                                 alice_agent,
                                 input_text,
-                                session=session,
+                                session=alice_session,
                                 max_turns=30,
                             )
                             print(f"Alice Turn {turn + 1}: {result.final_output}")
 
                             # Check if game is over
-                            if (
-                                "game over" in result.final_output.lower()
-                                or "congratulations" in result.final_output.lower()
-                            ):
+                            if _GAME_OVER_RE.search(result.final_output):
                                 print(
                                     "🎉 Alice detected game completion! Notifying Bob..."
                                 )
@@ -192,7 +257,6 @@ Always use the available MCP tools to interact with other agents. Be friendly an
 
                 # Run Bob with continuous loop
                 async def run_bob_continuous():
-                    session = SQLiteSession(session_id="bob")
                     input_text = "Wait for messages and participate in any games you're invited to."
 
                     for turn in range(30):  # Max 30 turns
@@ -204,16 +268,13 @@ Always use the available MCP tools to interact with other agents. Be friendly an
                             result = await Runner.run(
                                 bob_agent,
                                 input_text,
-                                session=session,
+                                session=bob_session,
                                 max_turns=30,
                             )
                             print(f"Bob Turn {turn + 1}: {result.final_output}")
 
                             # Check if game is over
-                            if (
-                                "game over" in result.final_output.lower()
-                                or "congratulations" in result.final_output.lower()
-                            ):
+                            if _GAME_OVER_RE.search(result.final_output):
                                 print(
                                     "🎉 Bob detected game completion! Notifying Alice..."
                                 )
@@ -240,6 +301,15 @@ Always use the available MCP tools to interact with other agents. Be friendly an
                 print("-" * 60)
                 print("🏁 Game session completed")
 
+                # Optional post-mortem transcript, written once outside the turn loop
+                dump_dir = os.getenv("THRONGLETS_SESSION_DUMP_DIR")
+                if dump_dir:
+                    Path(dump_dir).mkdir(parents=True, exist_ok=True)
+                    for session in (alice_session, bob_session):
+                        items = await session.get_items()
+                        dump_file = Path(dump_dir) / f"{session.session_id}.json"
+                        dump_file.write_text(json.dumps(items, default=str, indent=2))
+
                 # Print results
                 for i, result in enumerate(results):
                     agent_name = "Alice" if i == 0 else "Bob"
@@ -1,6 +1,8 @@
 """Thronglets - Multi-Agent ServiceBus based on A2A protocol."""
 
-from thronglets.client import Bus, BusClient
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from thronglets.models import (
     AgentCapabilities,
     AgentCard,
@@ -14,15 +16,18 @@ from thronglets.models import (
     TaskState,
     TaskStatus,
 )
-from thronglets.storage import (
-    MemoryStorage,
-    MemoryStorageConfig,
-    RedisStorage,
-    RedisStorageConfig,
-    Storage,
-    StorageConfig,
-    create_storage,
-)
+
+if TYPE_CHECKING:
+    from thronglets.client import Bus, BusClient
+    from thronglets.storage import (
+        MemoryStorage,
+        MemoryStorageConfig,
+        RedisStorage,
+        RedisStorageConfig,
+        Storage,
+        StorageConfig,
+        create_storage,
+    )
 
 __version__ = "0.1.0"
 
@@ -51,3 +56,26 @@ __all__ = [
     "RedisStorageConfig",
     "create_storage",
 ]
+
+# Heavy submodules (httpx, redis) are imported on first attribute access
+_LAZY_ATTRS = {
+    "Bus": "thronglets.client",
+    "BusClient": "thronglets.client",
+    "Storage": "thronglets.storage",
+    "StorageConfig": "thronglets.storage",
+    "MemoryStorage": "thronglets.storage",
+    "MemoryStorageConfig": "thronglets.storage",
+    "RedisStorage": "thronglets.storage",
+    "RedisStorageConfig": "thronglets.storage",
+    "create_storage": "thronglets.storage",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily exported names and cache them in module globals."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,41 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is an optional speedup (``pip install thronglets[speedups]``); the
+stdlib json module is used as a fallback with the same compact output.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def pre_encode(obj: Any) -> Any:
+    """Encode an object once for embedding in later ``dumps`` calls.
+
+    With orjson (3.9.14+) this returns a Fragment that is spliced into the
+    output verbatim; otherwise the object itself is returned unchanged.
+    """
+    fragment = getattr(orjson, "Fragment", None)
+    if fragment is None:
+        return obj
+    return fragment(orjson.dumps(obj))
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize JSON from a str or bytes payload."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -4,12 +4,18 @@ This module provides App registration with optional persistence via Storage.
 Apps are discovered and removed based on health check status.
 """
 
+from __future__ import annotations
+
 import asyncio
+import heapq
 import logging
+import time
+from collections import defaultdict
 from datetime import datetime
 
 import httpx
 
+from thronglets import _json
 from thronglets.models import AppCard, RegisteredApp
 
 logger = logging.getLogger(__name__)
@@ -28,6 +34,7 @@ class AppRegistry:
         health_check_interval: float = 30.0,
         health_check_timeout: float = 5.0,
         unhealthy_threshold: int = 3,
+        health_check_concurrency: int = 32,
     ) -> None:
         """Initialize the App registry.
 
@@ -35,13 +42,45 @@ class AppRegistry:
             health_check_interval: Seconds between health checks.
             health_check_timeout: Timeout for each health check request.
             unhealthy_threshold: Number of consecutive failures before marking app unhealthy.
+            health_check_concurrency: Maximum number of health checks in flight at once.
         """
-        self._failure_counts: dict[str, int] = {}
+        self._failure_counts: defaultdict[str, int] = defaultdict(int)
         self._health_check_interval = health_check_interval
         self._health_check_timeout = health_check_timeout
         self._unhealthy_threshold = unhealthy_threshold
+        self._health_check_concurrency = health_check_concurrency
         self._health_check_task: asyncio.Task | None = None
+        self._client: httpx.AsyncClient | None = None
         self._running = False
+        # Min-heap of (deadline, app_id); an entry is live only while it matches
+        # _next_check, so rescheduling never needs to search the heap.
+        self._schedule: list[tuple[float, str]] = []
+        self._next_check: dict[str, float] = {}
+        # Created per start_health_checks(), since an Event binds to one loop
+        self._wakeup: asyncio.Event | None = None
+        # When the schedule is next reconciled with storage, and the backend
+        # it was built from
+        self._next_reseed = 0.0
+        self._scheduled_storage = None
+        # Encoded app lists keyed by healthy_only, as (monotonic timestamp, bytes)
+        self._list_json: dict[bool, tuple[float, bytes]] = {}
+        self._version = 0
+        # ID sets kept in step with writes so counts rarely scan storage;
+        # None until first seeded, and re-seeded from storage after
+        # LIST_CACHE_MAX_AGE or a backend swap, as (monotonic timestamp, storage)
+        self._app_ids: set[str] | None = None
+        self._healthy_ids: set[str] = set()
+        self._seeded: tuple[float, object] | None = None
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every app write made through this registry."""
+        return self._version
+
+    def _apps_changed(self) -> None:
+        """Drop cached app listings after an app write."""
+        self._list_json.clear()
+        self._version += 1
 
     @property
     def _storage(self):
@@ -67,12 +106,18 @@ class AppRegistry:
             existing.healthy = True
             self._failure_counts[existing.app_id] = 0
             self._storage.update_app(existing)
+            self._apps_changed()
+            self._track(existing)
+            self._schedule_check(existing.app_id)
             logger.info(f"App renewed: {card.name} (id={existing.app_id})")
             return existing
 
         app = RegisteredApp(card=card)
         self._storage.register_app(app)
+        self._apps_changed()
+        self._track(app)
         self._failure_counts[app.app_id] = 0
+        self._schedule_check(app.app_id)
         logger.info(f"App registered: {card.name} (id={app.app_id})")
         return app
 
@@ -88,12 +133,81 @@ class AppRegistry:
         """
         return self._storage.list_apps(healthy_only=healthy_only)
 
+    def list_json(self, healthy_only: bool = True) -> bytes:
+        """List registered apps as an encoded ``{"apps", "total"}`` body.
+
+        Reused until an app is written through the registry or
+        LIST_CACHE_MAX_AGE elapses.
+
+        Args:
+            healthy_only: If True, only return healthy apps.
+        """
+        from thronglets.store import LIST_CACHE_MAX_AGE
+
+        now = time.monotonic()
+        cached = self._list_json.get(healthy_only)
+        if cached and now - cached[0] < LIST_CACHE_MAX_AGE:
+            return cached[1]
+        apps = self._storage.list_apps(healthy_only=healthy_only)
+        body = _json.dumps(
+            {"apps": [app.model_dump(mode="json") for app in apps], "total": len(apps)}
+        )
+        self._list_json[healthy_only] = (now, body)
+        return body
+
+    def counts(self) -> tuple[int, int]:
+        """Count registered apps without listing them.
+
+        Writes through this registry keep the counts current; they are
+        re-seeded from storage after LIST_CACHE_MAX_AGE, which bounds
+        staleness from writes made by other processes, and when
+        store.configure() has swapped the backend.
+
+        Returns:
+            Tuple of (all apps, healthy apps).
+        """
+        from thronglets.store import LIST_CACHE_MAX_AGE
+
+        seeded = self._seeded
+        if (
+            self._app_ids is None
+            or seeded is None
+            or seeded[1] is not self._storage
+            or time.monotonic() - seeded[0] >= LIST_CACHE_MAX_AGE
+        ):
+            self._seed_index()
+        return len(self._app_ids), len(self._healthy_ids)
+
+    def _seed_index(self) -> set[str]:
+        """Rebuild the app ID sets from storage and return all app IDs."""
+        storage = self._storage
+        apps = storage.list_apps(healthy_only=False)
+        self._app_ids = {app.app_id for app in apps}
+        self._healthy_ids = {app.app_id for app in apps if app.healthy}
+        self._seeded = (time.monotonic(), storage)
+        return self._app_ids
+
+    def _track(self, app: RegisteredApp) -> None:
+        """Record an app's latest health in the ID sets."""
+        if self._app_ids is None:
+            return
+        self._app_ids.add(app.app_id)
+        if app.healthy:
+            self._healthy_ids.add(app.app_id)
+        else:
+            self._healthy_ids.discard(app.app_id)
+
     def delete(self, app_id: str) -> bool:
         """Delete an app."""
         app = self._storage.get_app(app_id)
         if app:
             self._failure_counts.pop(app_id, None)
+            self._next_check.pop(app_id, None)
             result = self._storage.delete_app(app_id)
+            self._apps_changed()
+            if self._app_ids is not None:
+                self._app_ids.discard(app_id)
+            self._healthy_ids.discard(app_id)
             if result:
                 logger.info(f"App deleted: {app.card.name} (id={app_id})")
             return result
@@ -116,6 +230,9 @@ class AppRegistry:
         app.last_seen_at = datetime.now()
         self._failure_counts[app_id] = 0
         self._storage.update_app(app)
+        self._apps_changed()
+        self._track(app)
+        self._schedule_check(app_id)
         logger.info(f"App updated: {card.name} (id={app_id})")
         return app
 
@@ -126,70 +243,179 @@ class AppRegistry:
     async def _check_health(self, app: RegisteredApp) -> bool:
         """Check the health of a single app.
 
+        Probes with HEAD to skip the response body, falling back to GET for
+        endpoints that do not implement HEAD.
+
         Returns:
             True if healthy, False otherwise.
         """
+        if not self._client:
+            return False
         try:
-            async with httpx.AsyncClient(timeout=self._health_check_timeout) as client:
-                response = await client.get(app.card.health_check_url)
-                return response.status_code == 200
+            url = app.card.health_check_url
+            response = await self._client.head(url)
+            if response.status_code in (405, 501):
+                response = await self._client.get(url)
+            return response.status_code == 200
         except Exception as e:
             logger.debug(f"Health check failed for {app.card.name}: {e}")
             return False
 
+    def _schedule_check(self, app_id: str, delay: float | None = None) -> None:
+        """Schedule the next health check for an app.
+
+        Args:
+            app_id: The app's ID.
+            delay: Seconds until the check; defaults to the check interval.
+        """
+        if delay is None:
+            delay = self._health_check_interval
+        deadline = time.monotonic() + delay
+        self._next_check[app_id] = deadline
+        heapq.heappush(self._schedule, (deadline, app_id))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _reconcile_schedule(self) -> None:
+        """Schedule stored apps that have no pending check.
+
+        Runs once per check interval, so apps registered by other processes
+        sharing the storage are checked too. The schedule is rebuilt from
+        scratch when store.configure() has swapped the backend.
+        """
+        storage = self._storage
+        if storage is not self._scheduled_storage:
+            self._schedule.clear()
+            self._next_check.clear()
+            self._failure_counts.clear()
+            self._scheduled_storage = storage
+        for app_id in self._seed_index() - self._next_check.keys():
+            self._schedule_check(app_id, delay=0.0)
+        self._next_reseed = time.monotonic() + self._health_check_interval
+
+    def _pop_due(self) -> list[str]:
+        """Pop the IDs of all apps whose check deadline has passed."""
+        now = time.monotonic()
+        due = []
+        while self._schedule and self._schedule[0][0] <= now:
+            deadline, app_id = heapq.heappop(self._schedule)
+            # Skip entries superseded by a later reschedule or a delete
+            if self._next_check.get(app_id) == deadline:
+                del self._next_check[app_id]
+                due.append(app_id)
+        return due
+
     async def _health_check_loop(self) -> None:
-        """Background task that periodically checks app health."""
-        while self._running:
-            apps_to_check = self._storage.list_apps(healthy_only=False)
+        """Background task that checks each app when its deadline comes due."""
+        semaphore = asyncio.Semaphore(self._health_check_concurrency)
+        wakeup = self._wakeup
 
-            for app in apps_to_check:
-                # Re-fetch to check if still exists
-                current_app = self._storage.get_app(app.app_id)
-                if not current_app:
-                    continue
+        async def _guarded(app: RegisteredApp) -> tuple[RegisteredApp, bool]:
+            async with semaphore:
+                return app, await self._check_health(app)
 
-                healthy = await self._check_health(current_app)
+        while self._running:
+            wakeup.clear()
+            if time.monotonic() >= self._next_reseed:
+                self._reconcile_schedule()
+            due_ids = self._pop_due()
+
+            if not due_ids:
+                # Sleep until the earliest deadline or reconcile, or until a
+                # new app is scheduled
+                wake_at = self._next_reseed
+                if self._schedule:
+                    wake_at = min(wake_at, self._schedule[0][0])
+                try:
+                    await asyncio.wait_for(
+                        wakeup.wait(),
+                        timeout=max(0.0, wake_at - time.monotonic()),
+                    )
+                except TimeoutError:
+                    pass
+                continue
+
+            # Apps deleted since scheduling simply drop out of the schedule
+            found = self._storage.get_apps(due_ids)
+            apps_to_check = [found[app_id] for app_id in due_ids if app_id in found]
+
+            # Fan out checks so a batch takes ~one timeout instead of N
+            results = await asyncio.gather(
+                *(_guarded(app) for app in apps_to_check), return_exceptions=True
+            )
+
+            # Only persist apps whose health flipped or whose last_seen_at is stale
+            pending_updates: list[RegisteredApp] = []
+            stale_after = self._health_check_interval * 2
+            # One timestamp per batch is precise enough for last_seen_at
+            now = datetime.now()
+
+            for app, result in zip(apps_to_check, results):
+                if app.app_id not in self._next_check:
+                    self._schedule_check(app.app_id)
+
+                if isinstance(result, BaseException):
+                    logger.debug(f"Health check raised unexpectedly: {result}")
+                    continue
+                _, healthy = result
 
                 if healthy:
-                    if not current_app.healthy:
-                        current_app.healthy = True
-                        self._storage.update_app(current_app)
-                    current_app.last_seen_at = datetime.now()
-                    self._failure_counts[current_app.app_id] = 0
+                    changed = not app.healthy
+                    stale = (now - app.last_seen_at).total_seconds() > stale_after
+                    app.healthy = True
+                    app.last_seen_at = now
+                    self._failure_counts[app.app_id] = 0
+                    if changed or stale:
+                        pending_updates.append(app)
                 else:
-                    self._failure_counts[current_app.app_id] = (
-                        self._failure_counts.get(current_app.app_id, 0) + 1
-                    )
+                    self._failure_counts[app.app_id] += 1
+                    failures = self._failure_counts[app.app_id]
 
-                    if current_app.healthy:
-                        current_app.healthy = False
-                        self._storage.update_app(current_app)
+                    if app.healthy:
+                        app.healthy = False
+                        pending_updates.append(app)
 
-                    if (
-                        self._failure_counts[current_app.app_id]
-                        >= self._unhealthy_threshold
-                    ):
+                    if failures >= self._unhealthy_threshold:
                         logger.warning(
-                            f"App marked unhealthy: {current_app.card.name} "
-                            f"(id={current_app.app_id}, failures={self._failure_counts[current_app.app_id]})"
+                            f"App marked unhealthy: {app.card.name} "
+                            f"(id={app.app_id}, failures={failures})"
                         )
 
-            await asyncio.sleep(self._health_check_interval)
+            if pending_updates:
+                self._storage.bulk_update_apps(pending_updates)
+                self._apps_changed()
+                for app in pending_updates:
+                    self._track(app)
 
     def start_health_checks(self) -> None:
         """Start the background health check task."""
         if self._running:
             return
         self._running = True
+        # The loop reconciles with storage first, so persisted apps are
+        # checked right away
+        self._schedule.clear()
+        self._next_check.clear()
+        self._next_reseed = 0.0
+        self._wakeup = asyncio.Event()
+        # Shared client keeps connections to health endpoints alive across ticks
+        self._client = httpx.AsyncClient(
+            timeout=self._health_check_timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=100, keepalive_expiry=60),
+        )
         self._health_check_task = asyncio.create_task(self._health_check_loop())
         logger.info("Health check service started")
 
-    def stop_health_checks(self) -> None:
+    async def stop_health_checks(self) -> None:
         """Stop the background health check task."""
         self._running = False
         if self._health_check_task:
             self._health_check_task.cancel()
             self._health_check_task = None
+        if self._client:
+            await self._client.aclose()
+            self._client = None
         logger.info("Health check service stopped")
 
 
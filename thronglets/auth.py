@@ -5,6 +5,8 @@ Clients should obtain access_token from Supabase and pass it as Bearer token.
 """
 
 import os
+from functools import lru_cache
+
 from fastmcp.server.auth import AuthProvider
 
 # Auth enabled flag
@@ -15,9 +17,12 @@ SUPABASE_PROJECT_URL = os.getenv("THRONGLETS_SUPABASE_PROJECT_URL", "")
 SUPABASE_ANON_KEY = os.getenv("THRONGLETS_SUPABASE_ANON_KEY", "")
 
 
+@lru_cache(maxsize=1)
 def get_auth_provider() -> AuthProvider | None:
     """Get the JWT authentication provider.
 
+    The verifier is built once per process so its JWKS cache is reused.
+
     Returns:
         JWTVerifier if auth is enabled and configured, None otherwise.
     """
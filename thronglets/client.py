@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import threading
 
 import httpx
 
+from thronglets import _json
 from thronglets.models import AgentCard, RegisteredAgent
 
+logger = logging.getLogger(__name__)
+
+# Clients only ever talk to one ServiceBus host, so a small pool suffices
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60)
+
 
 class BusClientError(Exception):
     """Exception raised by BusClient operations."""
@@ -46,9 +53,16 @@ class BusClient:
         """
         self.url = url.rstrip("/")
         self._agent_card = (
-            agent_card if isinstance(agent_card, AgentCard) else AgentCard(**agent_card)
+            agent_card
+            if isinstance(agent_card, AgentCard)
+            else AgentCard.model_validate(agent_card)
         )
         self.health_check_interval = health_check_interval
+        # The card is fixed for the client's lifetime, so serialize it once
+        self._agent_card_bytes = _json.dumps(
+            self._agent_card.model_dump(mode="json", exclude_none=True)
+        )
+        self._agent_card_headers = {"content-type": "application/json"}
 
         self._registered_agent: RegisteredAgent | None = None
         self._http_client: httpx.Client | None = None
@@ -57,6 +71,7 @@ class BusClient:
         self._health_check_task: asyncio.Task | None = None
         self._health_check_thread: threading.Thread | None = None
         self._stop_health_check = threading.Event()
+        self._stop_health_check_async: asyncio.Event | None = None
 
     @property
     def agent_id(self) -> str | None:
@@ -82,7 +97,7 @@ class BusClient:
 
     def __enter__(self) -> "BusClient":
         """Enter the context manager (sync)."""
-        self._http_client = httpx.Client(timeout=30.0)
+        self._http_client = httpx.Client(timeout=30.0, http2=True, limits=_HTTP_LIMITS)
         self._register_agent_sync()
         self._start_health_check_thread()
         return self
@@ -101,19 +116,28 @@ class BusClient:
 
     async def __aenter__(self) -> "BusClient":
         """Enter the context manager (async)."""
-        self._async_http_client = httpx.AsyncClient(timeout=30.0)
+        self._async_http_client = httpx.AsyncClient(
+            timeout=30.0, http2=True, limits=_HTTP_LIMITS
+        )
         await self._register_agent_async()
+        self._stop_health_check_async = asyncio.Event()
         self._health_check_task = asyncio.create_task(self._health_check_loop())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit the context manager (async)."""
+        if self._stop_health_check_async:
+            self._stop_health_check_async.set()
         if self._health_check_task:
-            self._health_check_task.cancel()
-            try:
-                await self._health_check_task
-            except asyncio.CancelledError:
-                pass
+            # The loop exits on its own once signalled; only cancel a stuck heartbeat
+            _, pending = await asyncio.wait({self._health_check_task}, timeout=5.0)
+            if pending:
+                self._health_check_task.cancel()
+                try:
+                    await self._health_check_task
+                except asyncio.CancelledError:
+                    pass
+            self._health_check_task = None
         await self._unregister_agent_async()
         if self._async_http_client:
             await self._async_http_client.aclose()
@@ -128,7 +152,8 @@ class BusClient:
 
         response = self._http_client.post(
             f"{self.url}/agents",
-            json=self._agent_card.model_dump(),
+            content=self._agent_card_bytes,
+            headers=self._agent_card_headers,
         )
         if response.status_code != 200:
             raise BusClientError(f"Failed to register agent: {response.text}")
@@ -143,7 +168,8 @@ class BusClient:
 
         response = await self._async_http_client.post(
             f"{self.url}/agents",
-            json=self._agent_card.model_dump(),
+            content=self._agent_card_bytes,
+            headers=self._agent_card_headers,
         )
         if response.status_code != 200:
             raise BusClientError(f"Failed to register agent: {response.text}")
@@ -177,6 +203,40 @@ class BusClient:
             pass  # Best effort
         self._registered_agent = None
 
+    def _heartbeat_sync(self) -> None:
+        """Renew the agent registration via the heartbeat endpoint (sync).
+
+        Falls back to a full re-register if the ServiceBus no longer knows
+        the agent (e.g. after a restart or TTL eviction).
+        """
+        if not self._http_client or not self._registered_agent:
+            raise BusClientError("Agent not registered")
+
+        response = self._http_client.patch(
+            f"{self.url}/agents/{self._registered_agent.agent_id}/heartbeat"
+        )
+        if response.status_code == 404:
+            self._register_agent_sync()
+        elif response.status_code != 200:
+            raise BusClientError(f"Heartbeat failed: {response.text}")
+
+    async def _heartbeat_async(self) -> None:
+        """Renew the agent registration via the heartbeat endpoint (async).
+
+        Falls back to a full re-register if the ServiceBus no longer knows
+        the agent (e.g. after a restart or TTL eviction).
+        """
+        if not self._async_http_client or not self._registered_agent:
+            raise BusClientError("Agent not registered")
+
+        response = await self._async_http_client.patch(
+            f"{self.url}/agents/{self._registered_agent.agent_id}/heartbeat"
+        )
+        if response.status_code == 404:
+            await self._register_agent_async()
+        elif response.status_code != 200:
+            raise BusClientError(f"Heartbeat failed: {response.text}")
+
     # ============ Health Check ============
 
     def _start_health_check_thread(self) -> None:
@@ -191,32 +251,29 @@ class BusClient:
         """Health check thread function."""
         while not self._stop_health_check.wait(self.health_check_interval):
             try:
-                self._register_agent_sync()
-                print(
-                    f"🔄 Health check: Registered agent {self._registered_agent.agent_id}"
-                )
-            except Exception:
-                print(
-                    f"❌ Health check failed for agent {self._registered_agent.agent_id}"
-                )
-                pass
+                self._heartbeat_sync()
+                logger.debug(f"Health check: renewed agent {self.agent_id}")
+            except Exception as e:
+                logger.warning(f"Health check failed for agent {self.agent_id}: {e}")
 
     async def _health_check_loop(self) -> None:
         """Async health check loop."""
         while True:
-            await asyncio.sleep(self.health_check_interval)
             try:
-                await self._register_agent_async()
-                print(
-                    f"🔄 Health check: Registered agent {self._registered_agent.agent_id}"
+                await asyncio.wait_for(
+                    self._stop_health_check_async.wait(),
+                    timeout=self.health_check_interval,
                 )
-            except asyncio.CancelledError:
                 break
-            except Exception:
-                print(
-                    f"❌ Health check failed for agent {self._registered_agent.agent_id}"
-                )
+            except TimeoutError:
                 pass
+            try:
+                await self._heartbeat_async()
+                logger.debug(f"Health check: renewed agent {self.agent_id}")
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Health check failed for agent {self.agent_id}: {e}")
 
 
 # Convenience alias
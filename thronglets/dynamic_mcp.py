@@ -5,19 +5,223 @@ Uses direct HTTP calls with SSE support for compatibility with MCP servers.
 """
 
 import asyncio
-import json
+import itertools
 import logging
-from datetime import datetime
+import time
 from typing import Any
 
 import httpx
 
+from thronglets import _json
+
 logger = logging.getLogger(__name__)
 
 
-# Tool list cache for Apps (TTL: 5 minutes)
-_tools_cache: dict[str, tuple[datetime, list[dict[str, Any]]]] = {}
+# Tool list cache for Apps (TTL: 5 minutes), app_id -> (expires_at, tools).
+# Expiry uses the monotonic clock; expired entries are evicted lazily.
+_tools_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
 _tools_cache_ttl = 300.0  # 5 minutes
+_tools_cache_maxsize = 1024
+
+
+def get_cached_tools(app_id: str) -> list[dict[str, Any]] | None:
+    """Get an app's cached tools list if present and not expired.
+
+    Args:
+        app_id: The app ID.
+
+    Returns:
+        The cached tool definitions, or None on a cache miss.
+    """
+    entry = _tools_cache.get(app_id)
+    if entry is None:
+        return None
+    expires_at, tools = entry
+    if time.monotonic() >= expires_at:
+        _tools_cache.pop(app_id, None)
+        return None
+    return tools
+
+
+def _cache_tools(app_id: str, tools: list[dict[str, Any]]) -> None:
+    """Store an app's tools list, evicting entries when the cache is full."""
+    now = time.monotonic()
+    _tools_cache.pop(app_id, None)
+    if len(_tools_cache) >= _tools_cache_maxsize:
+        # Drop expired entries first, then the oldest insertions
+        for key in [k for k, (exp, _) in _tools_cache.items() if exp <= now]:
+            del _tools_cache[key]
+        while len(_tools_cache) >= _tools_cache_maxsize:
+            del _tools_cache[next(iter(_tools_cache))]
+    _tools_cache[app_id] = (now + _tools_cache_ttl, tools)
+
+
+# In-flight tool fetches per app, used to coalesce concurrent cache misses
+_inflight_fetches: dict[str, asyncio.Task] = {}
+
+# MCP session IDs per endpoint, reused to skip the initialize round-trip
+_session_cache: dict[str, tuple[float, str]] = {}
+_session_ttl = 600.0  # 10 minutes
+
+# JSON-RPC request IDs must be unique within a session once sessions are shared
+_request_ids = itertools.count(2)
+
+# Constant JSON-RPC bodies, encoded once at import. initialize always opens a
+# fresh session so its ID can be fixed; tools/list splices in a unique ID.
+_INIT_BODY = _json.dumps(
+    {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2025-11-25",
+            "capabilities": {},
+            "clientInfo": {
+                "name": "Thronglets ServiceBus",
+                "version": "0.1.0",
+            },
+        },
+    }
+)
+_TOOLS_LIST_BODY = b'{"jsonrpc":"2.0","id":%d,"method":"tools/list","params":{}}'
+
+# Sent on every request by the shared client, so callers only add per-call headers
+_MCP_HEADERS = {
+    "Accept": "application/json, text/event-stream",
+    "Content-Type": "application/json",
+}
+
+# Shared HTTP client for App MCP endpoints, kept open for connection reuse
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            headers=_MCP_HEADERS,
+            timeout=httpx.Timeout(30.0, connect=5.0, write=5.0, pool=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=200,
+                keepalive_expiry=30.0,
+            ),
+            http2=True,
+        )
+    return _shared_client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+def _cached_session(mcp_endpoint: str) -> str | None:
+    """Get a still-valid cached session ID for an endpoint."""
+    cached = _session_cache.get(mcp_endpoint)
+    if cached and time.monotonic() - cached[0] < _session_ttl:
+        return cached[1]
+    return None
+
+
+async def _ensure_session(client: httpx.AsyncClient, mcp_endpoint: str) -> str | None:
+    """Get a session ID for an endpoint, initializing a new MCP session if needed.
+
+    Returns:
+        The session ID, or None if the session could not be established.
+    """
+    session_id = _cached_session(mcp_endpoint)
+    if session_id:
+        return session_id
+
+    response = await client.post(mcp_endpoint, content=_INIT_BODY)
+
+    if response.status_code != 200:
+        logger.error("Initialize request failed: %s", response.status_code)
+        return None
+
+    # Extract session ID from response headers
+    session_id = response.headers.get("mcp-session-id") or response.headers.get(
+        "x-session-id"
+    )
+
+    if not session_id:
+        logger.error("No session ID found in response headers")
+        return None
+
+    logger.info("Session established: %s", session_id)
+    _session_cache[mcp_endpoint] = (time.monotonic(), session_id)
+    return session_id
+
+
+# SSE events end with a blank line; servers may use LF or CRLF line endings
+_SSE_EVENT_SEPARATORS = (b"\r\n\r\n", b"\n\n")
+
+
+def _sse_event_data(event: bytes) -> bytes | None:
+    """Extract the joined data field from a single raw SSE event."""
+    data_lines = []
+    for line in event.splitlines():
+        field, _, value = line.partition(b":")
+        if field == b"data":
+            data_lines.append(value[1:] if value.startswith(b" ") else value)
+    return b"\n".join(data_lines) if data_lines else None
+
+
+async def read_first_sse_data(response: httpx.Response) -> bytes | None:
+    """Read a streamed SSE response until the first event that carries data.
+
+    Stops reading as soon as one complete event is parsed, so large payloads
+    are never materialised as a single decoded string.
+
+    Returns:
+        The raw data payload of the first event, or None if there was none.
+    """
+    buffer = bytearray()
+    async for chunk in response.aiter_bytes():
+        # Only rescan the tail that could complete a separator split across chunks
+        scan_from = max(0, len(buffer) - 3)
+        buffer += chunk
+        while True:
+            matches = [
+                (index, len(sep))
+                for sep in _SSE_EVENT_SEPARATORS
+                if (index := buffer.find(sep, scan_from)) != -1
+            ]
+            if not matches:
+                break
+            end, sep_len = min(matches)
+            data = _sse_event_data(bytes(buffer[:end]))
+            if data is not None:
+                return data
+            del buffer[: end + sep_len]
+            scan_from = 0
+
+    # Tolerate a final event without the trailing blank line
+    return _sse_event_data(bytes(buffer)) if buffer else None
+
+
+async def _call_tools_list(
+    client: httpx.AsyncClient, mcp_endpoint: str, session_id: str
+) -> tuple[int, bytes | None]:
+    """Call tools/list on an endpoint within an existing session.
+
+    Returns:
+        Tuple of (HTTP status code, JSON-RPC payload from the first SSE event).
+    """
+    async with client.stream(
+        "POST",
+        mcp_endpoint,
+        content=_TOOLS_LIST_BODY % next(_request_ids),
+        headers={"mcp-session-id": session_id},
+    ) as response:
+        if response.status_code != 200:
+            return response.status_code, None
+        return response.status_code, await read_first_sse_data(response)
 
 
 async def get_app_tools(app_id: str, mcp_endpoint: str) -> list[dict[str, Any]]:
@@ -31,120 +235,92 @@ async def get_app_tools(app_id: str, mcp_endpoint: str) -> list[dict[str, Any]]:
         List of tool definitions.
     """
     # Check cache
-    if app_id in _tools_cache:
-        cached_time, tools = _tools_cache[app_id]
-        if (datetime.now() - cached_time).total_seconds() < _tools_cache_ttl:
-            return tools
+    cached_tools = get_cached_tools(app_id)
+    if cached_tools is not None:
+        return cached_tools
+
+    # Single-flight: concurrent cache misses for one app share a single fetch
+    fetch = _inflight_fetches.get(app_id)
+    if fetch is None:
+        fetch = asyncio.create_task(_fetch_app_tools(app_id, mcp_endpoint))
+        _inflight_fetches[app_id] = fetch
+        fetch.add_done_callback(lambda _: _inflight_fetches.pop(app_id, None))
+
+    # Shield so one cancelled caller does not abort the fetch for the others
+    return await asyncio.shield(fetch)
 
-    # Fetch from App
+
+async def _fetch_app_tools(app_id: str, mcp_endpoint: str) -> list[dict[str, Any]]:
+    """Fetch and cache the tools list from an App's MCP endpoint.
+
+    Returns:
+        List of tool definitions, or an empty list on failure.
+    """
     try:
-        logger.info(f"Fetching tools from app {app_id} at {mcp_endpoint}")
+        logger.info("Fetching tools from app %s at %s", app_id, mcp_endpoint)
 
         try:
-            async with asyncio.timeout(30.0):
-                # Create httpx client with required headers for SSE
-                headers = {
-                    "Accept": "application/json, text/event-stream",
-                    "Content-Type": "application/json",
+            client = get_client()
+            reused_session = _cached_session(mcp_endpoint) is not None
+
+            session_id = await _ensure_session(client, mcp_endpoint)
+            if not session_id:
+                return []
+
+            status_code, tools_json_data = await _call_tools_list(
+                client, mcp_endpoint, session_id
+            )
+
+            if status_code != 200 and reused_session:
+                # The App may have dropped our cached session; re-initialize once
+                _session_cache.pop(mcp_endpoint, None)
+                session_id = await _ensure_session(client, mcp_endpoint)
+                if not session_id:
+                    return []
+                status_code, tools_json_data = await _call_tools_list(
+                    client, mcp_endpoint, session_id
+                )
+
+            if status_code != 200:
+                logger.error("Tools request failed: %s", status_code)
+                return []
+
+            if tools_json_data is None:
+                logger.error("Invalid SSE response format")
+                return []
+
+            tools_result = _json.loads(tools_json_data)
+
+            tools = tools_result.get("result", {}).get("tools", [])
+            # Normalize once here; callers serve these dicts as-is without
+            # re-validating them
+            processed_tools = [
+                {
+                    "name": tool.get("name") or "",
+                    "description": tool.get("description") or "",
+                    "inputSchema": tool.get("inputSchema") or {},
                 }
+                for tool in tools
+                if isinstance(tool, dict)
+            ]
+
+            logger.info(
+                "Successfully fetched %d tools from %s", len(processed_tools), app_id
+            )
+
+            # Cache result
+            _cache_tools(app_id, processed_tools)
 
-                async with httpx.AsyncClient(headers=headers, timeout=30.0) as client:
-                    # Initialize MCP session
-                    init_request = {
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "initialize",
-                        "params": {
-                            "protocolVersion": "2025-11-25",
-                            "capabilities": {},
-                            "clientInfo": {
-                                "name": "Thronglets ServiceBus",
-                                "version": "0.1.0",
-                            },
-                        },
-                    }
-
-                    response = await client.post(mcp_endpoint, json=init_request)
-
-                    if response.status_code != 200:
-                        logger.error(
-                            f"Initialize request failed: {response.status_code}"
-                        )
-                        return []
-
-                    # Extract session ID from response headers
-                    session_id = response.headers.get(
-                        "mcp-session-id"
-                    ) or response.headers.get("x-session-id")
-
-                    if not session_id:
-                        logger.error("No session ID found in response headers")
-                        return []
-
-                    logger.info(f"Session established: {session_id}")
-
-                    # Call tools/list with session ID
-                    tools_request = {
-                        "jsonrpc": "2.0",
-                        "id": 2,
-                        "method": "tools/list",
-                        "params": {},
-                    }
-
-                    session_headers = headers.copy()
-                    session_headers["mcp-session-id"] = session_id
-
-                    tools_response = await client.post(
-                        mcp_endpoint, json=tools_request, headers=session_headers
-                    )
-
-                    if tools_response.status_code != 200:
-                        logger.error(
-                            f"Tools request failed: {tools_response.status_code}"
-                        )
-                        return []
-
-                    # Parse SSE response
-                    tools_content = tools_response.text
-                    if "data: " not in tools_content:
-                        logger.error("Invalid SSE response format")
-                        return []
-
-                    tools_json_data = tools_content.split("data: ")[1].strip()
-                    tools_result = json.loads(tools_json_data)
-
-                    tools = tools_result.get("result", {}).get("tools", [])
-                    processed_tools = [
-                        {
-                            "name": tool.get("name", ""),
-                            "description": tool.get("description", ""),
-                            "inputSchema": tool.get("inputSchema", {}),
-                        }
-                        for tool in tools
-                        if tool is not None
-                    ]
-
-                    logger.info(
-                        f"Successfully fetched {len(processed_tools)} tools from {app_id}"
-                    )
-
-                    # Cache result
-                    _tools_cache[app_id] = (datetime.now(), processed_tools)
-
-                    return processed_tools
-
-        except asyncio.TimeoutError:
-            logger.error(f"Timeout while connecting to MCP endpoint: {mcp_endpoint}")
+            return processed_tools
+
+        except httpx.TimeoutException:
+            logger.error("Timeout while connecting to MCP endpoint: %s", mcp_endpoint)
             return []
 
-    except Exception as e:
-        logger.error(
-            f"Failed to get tools from app {app_id}: {e}, endpoint: {mcp_endpoint}"
+    except Exception:
+        logger.exception(
+            "Failed to get tools from app %s, endpoint: %s", app_id, mcp_endpoint
         )
-        logger.error(f"Exception type: {type(e)}")
-        import traceback
-
-        logger.error(f"Traceback: {traceback.format_exc()}")
         return []
 
 
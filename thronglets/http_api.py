@@ -1,21 +1,26 @@
 """HTTP API service using FastAPI."""
 
+import base64
+import binascii
 import logging
 import os
 import sys
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.logger import logger
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
+from thronglets import _json
 from thronglets.app_registry import app_registry
 from thronglets.auth import AUTH_ENABLED, get_auth_config
-from thronglets.dynamic_mcp import get_app_tools
+from thronglets.dynamic_mcp import close_client, get_app_tools
 from thronglets.mcp_server import mcp
 from thronglets.models import (
     AgentCapabilities,
@@ -36,6 +41,8 @@ from thronglets.store import store
 THRONGLETS_HOST = os.getenv("THRONGLETS_HOST", "localhost")
 THRONGLETS_PORT = os.getenv("THRONGLETS_PORT", "8000")
 THRONGLETS_MCP_PATH = os.getenv("THRONGLETS_MCP_PATH", "/bus/mcp")
+THRONGLETS_DEBUG = os.getenv("THRONGLETS_DEBUG", "false").lower() == "true"
+THRONGLETS_ACCESS_LOG = os.getenv("THRONGLETS_ACCESS_LOG", "false").lower() == "true"
 
 bus_mcp = mcp.http_app(transport="streamable-http", path="/mcp")
 
@@ -50,7 +57,9 @@ async def lifespan(app: FastAPI):
         yield
 
     # Cleanup on shutdown
-    app_registry.stop_health_checks()
+    await app_registry.stop_health_checks()
+    await store.close_send_pump()
+    await close_client()
 
 
 app = FastAPI(
@@ -58,8 +67,11 @@ app = FastAPI(
     description="Multi-Agent ServiceBus based on A2A protocol",
     version="0.1.0",
     lifespan=lifespan,
-    debug=True,
+    debug=THRONGLETS_DEBUG,
 )
+# Compress large JSON bodies (tool manifests, task histories); Starlette leaves
+# the MCP text/event-stream responses uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 app.mount("/bus", bus_mcp)
 logger.setLevel(logging.DEBUG)
 
@@ -145,132 +157,165 @@ SERVICE_BUS_CARD = AgentCard(
 )
 
 # MCP Tools metadata
-MCP_TOOLS = [
-    {
-        "name": "agent__list",
-        "description": "List all registered agents in the ServiceBus",
-        "category": "Agent",
-    },
-    {
-        "name": "agent__whoami",
-        "description": "Get the current agent's information",
-        "category": "Agent",
-    },
-    {
-        "name": "message__send",
-        "description": "Send a message to another agent",
-        "category": "Message",
-    },
-    {
-        "name": "message__receive",
-        "description": "Receive messages sent to this agent",
-        "category": "Message",
-    },
-    {
-        "name": "task__create",
-        "description": "Create a new task",
-        "category": "Task",
-    },
-    {
-        "name": "task__get",
-        "description": "Get a task by ID",
-        "category": "Task",
-    },
-    {
-        "name": "task__list",
-        "description": "List tasks with optional filtering",
-        "category": "Task",
-    },
-    {
-        "name": "task__update_status",
-        "description": "Update a task's status",
-        "category": "Task",
-    },
-    {
-        "name": "task__cancel",
-        "description": "Cancel a task",
-        "category": "Task",
-    },
-    {
-        "name": "app__list",
-        "description": "List all available Apps (scenario-based MCP services)",
-        "category": "App",
-    },
-    {
-        "name": "app__get",
-        "description": "Get detailed information about a specific App",
-        "category": "App",
-    },
-]
+MCP_TOOLS = tuple(
+    MappingProxyType(tool)
+    for tool in [
+        {
+            "name": "agent__list",
+            "description": "List all registered agents in the ServiceBus",
+            "category": "Agent",
+        },
+        {
+            "name": "agent__whoami",
+            "description": "Get the current agent's information",
+            "category": "Agent",
+        },
+        {
+            "name": "message__send",
+            "description": "Send a message to another agent",
+            "category": "Message",
+        },
+        {
+            "name": "message__send_batch",
+            "description": "Send several messages to other agents in one call",
+            "category": "Message",
+        },
+        {
+            "name": "message__receive",
+            "description": "Receive messages sent to this agent",
+            "category": "Message",
+        },
+        {
+            "name": "task__create",
+            "description": "Create a new task",
+            "category": "Task",
+        },
+        {
+            "name": "task__get",
+            "description": "Get a task by ID",
+            "category": "Task",
+        },
+        {
+            "name": "task__list",
+            "description": "List tasks with optional filtering",
+            "category": "Task",
+        },
+        {
+            "name": "task__update_status",
+            "description": "Update a task's status",
+            "category": "Task",
+        },
+        {
+            "name": "task__cancel",
+            "description": "Cancel a task",
+            "category": "Task",
+        },
+        {
+            "name": "app__list",
+            "description": "List all available Apps (scenario-based MCP services)",
+            "category": "App",
+        },
+        {
+            "name": "app__get",
+            "description": "Get detailed information about a specific App",
+            "category": "App",
+        },
+    ]
+)
+
+
+def _json_response(content: BaseModel | dict | bytes) -> Response:
+    """Encode an already-validated result as a JSON response.
+
+    Routes keep response_model for the OpenAPI schema, but returning a
+    Response skips FastAPI re-validating the value against it.
+    """
+    if isinstance(content, BaseModel):
+        content = content.model_dump(mode="json")
+    if not isinstance(content, bytes):
+        content = _json.dumps(content)
+    return Response(content=content, media_type="application/json")
+
+
+# Static parts of /system/info and the well-known card, built once at import
+_BASE_URL = f"http://{THRONGLETS_HOST}:{THRONGLETS_PORT}"
+_MCP_URL = f"{_BASE_URL}{THRONGLETS_MCP_PATH}"
+_SYSTEM_INFO_MCP = {
+    "endpoint": _MCP_URL,
+    "transport": "streamable-http",
+    # The tool list is the bulk of the payload; encode it only once
+    "tools": _json.pre_encode([dict(tool) for tool in MCP_TOOLS]),
+    "auth": get_auth_config(),
+}
+_SYSTEM_INFO_ENDPOINTS = {
+    "base_url": _BASE_URL,
+    "mcp_url": _MCP_URL,
+    "agent_card": f"{_BASE_URL}/.well-known/agent",
+}
+_SERVICE_BUS_CARD_BYTES = _json.dumps(SERVICE_BUS_CARD.model_dump(mode="json"))
 
 
 # System info endpoint
 @app.get("/system/info")
-async def get_system_info() -> dict:
+async def get_system_info() -> Response:
     """Get system information including MCP tools and health status."""
-    base_url = f"http://{THRONGLETS_HOST}:{THRONGLETS_PORT}"
-    mcp_url = f"{base_url}{THRONGLETS_MCP_PATH}"
-
-    agents = store.list_agents()
-    apps = app_registry.list(healthy_only=False)
-    healthy_apps = [a for a in apps if a.healthy]
-
-    return {
-        "name": "Thronglets ServiceBus",
-        "version": "0.1.0",
-        "description": "Multi-Agent ServiceBus for agent registration, discovery, and communication based on A2A protocol",
-        "mcp": {
-            "endpoint": mcp_url,
-            "transport": "streamable-http",
-            "tools": MCP_TOOLS,
-            "auth": get_auth_config(),
-        },
-        "health": {
-            "status": "healthy",
-            "agents_count": len(agents),
-            "apps_count": len(apps),
-            "healthy_apps_count": len(healthy_apps),
-        },
-        "endpoints": {
-            "base_url": base_url,
-            "mcp_url": mcp_url,
-            "agent_card": f"{base_url}/.well-known/agent",
-        },
+    agents_count = store.count_agents()
+    apps_count, healthy_apps_count = app_registry.counts()
+
+    health = {
+        "status": "healthy",
+        "agents_count": agents_count,
+        "apps_count": apps_count,
+        "healthy_apps_count": healthy_apps_count,
     }
+    return _json_response(
+        {
+            "name": "Thronglets ServiceBus",
+            "version": "0.1.0",
+            "description": "Multi-Agent ServiceBus for agent registration, discovery, and communication based on A2A protocol",
+            "mcp": _SYSTEM_INFO_MCP,
+            "health": health,
+            "endpoints": _SYSTEM_INFO_ENDPOINTS,
+        }
+    )
 
 
 # Well-known endpoint
 @app.get("/.well-known/agent", response_model=AgentCard)
-async def get_agent_card() -> AgentCard:
+async def get_agent_card() -> Response:
     """Get the ServiceBus's AgentCard."""
-    return SERVICE_BUS_CARD
+    return _json_response(_SERVICE_BUS_CARD_BYTES)
 
 
 # Agent endpoints
 @app.post("/agents", response_model=RegisteredAgent)
-async def register_agent(card: AgentCard) -> RegisteredAgent:
+async def register_agent(card: AgentCard) -> Response:
     """Register a new agent or renew existing agent registration."""
-    # Check if agent with same name already exists (for renewal)
-    existing_agents = store.list_agents()
-    for existing_agent in existing_agents:
-        if (
-            existing_agent.card.name == card.name
-            and existing_agent.card.version == card.version
-        ):
-            # This is a renewal, update last_seen_at and keep same agent_id
-            existing_agent.last_seen_at = datetime.now()
-            store.register_agent(existing_agent)  # This will update TTL
-            return existing_agent
+    # Check if agent with same name and version already exists (for renewal)
+    existing_agent = store.find_agent_by_name_version(card.name, card.version)
+    if existing_agent:
+        # This is a renewal, update last_seen_at and keep same agent_id
+        existing_agent.last_seen_at = datetime.now()
+        store.register_agent(existing_agent)  # This will update TTL
+        return _json_response(existing_agent)
     # This is a new registration
     agent = RegisteredAgent(card=card)
-    return store.register_agent(agent)
+    return _json_response(store.register_agent(agent))
 
 
 @app.get("/agents", response_model=AgentListResponse)
-async def list_agents() -> AgentListResponse:
+async def list_agents() -> Response:
     """List all registered agents."""
-    agents = store.list_agents()
-    return AgentListResponse(agents=agents, total=len(agents))
+    return _json_response(store.list_agents_json())
+
+
+@app.patch("/agents/{agent_id}/heartbeat")
+async def heartbeat_agent(agent_id: str) -> dict:
+    """Renew an agent's registration without resubmitting its card."""
+    agent = store.touch_agent(agent_id)
+    if not agent:
+        raise HTTPException(status_code=404, detail="Agent not found")
+    return {"status": "ok", "agent_id": agent_id}
 
 
 @app.delete("/agents/{agent_id}")
@@ -283,42 +328,41 @@ async def delete_agent(agent_id: str) -> dict:
 
 # App endpoints
 @app.post("/apps", response_model=RegisteredApp)
-async def register_app(card: AppCard) -> RegisteredApp:
+async def register_app(card: AppCard) -> Response:
     """Register a new app or renew existing app registration.
 
     The app must provide a health_check_url for health monitoring.
     Unhealthy apps will be automatically removed.
     """
-    return app_registry.register(card)
+    return _json_response(app_registry.register(card))
 
 
 @app.get("/apps", response_model=AppListResponse)
-async def list_apps(healthy_only: bool = Query(True)) -> AppListResponse:
+async def list_apps(healthy_only: bool = Query(True)) -> Response:
     """List all registered apps.
 
     Args:
         healthy_only: If true, only return healthy apps (default: true).
     """
-    apps = app_registry.list(healthy_only=healthy_only)
-    return AppListResponse(apps=apps, total=len(apps))
+    return _json_response(app_registry.list_json(healthy_only=healthy_only))
 
 
 @app.get("/apps/{app_id}", response_model=RegisteredApp)
-async def get_app(app_id: str) -> RegisteredApp:
+async def get_app(app_id: str) -> Response:
     """Get an app by ID."""
     app_instance = app_registry.get(app_id)
     if not app_instance:
         raise HTTPException(status_code=404, detail="App not found")
-    return app_instance
+    return _json_response(app_instance)
 
 
 @app.put("/apps/{app_id}", response_model=RegisteredApp)
-async def update_app(app_id: str, card: AppCard) -> RegisteredApp:
+async def update_app(app_id: str, card: AppCard) -> Response:
     """Update an existing app."""
     app_instance = app_registry.get(app_id)
     if not app_instance:
         raise HTTPException(status_code=404, detail="App not found")
-    return app_registry.update(app_id, card)
+    return _json_response(app_registry.update(app_id, card))
 
 
 @app.delete("/apps/{app_id}")
@@ -330,7 +374,7 @@ async def delete_app(app_id: str) -> dict:
 
 
 @app.get("/apps/{app_id}/tools", response_model=AppToolsResponse)
-async def get_app_tools_endpoint(app_id: str) -> AppToolsResponse:
+async def get_app_tools_endpoint(app_id: str) -> Response:
     """Get the list of MCP tools provided by an app.
 
     Connects to the app's MCP endpoint and retrieves available tools.
@@ -345,10 +389,14 @@ async def get_app_tools_endpoint(app_id: str) -> AppToolsResponse:
 
     try:
         tools = await get_app_tools(app_id, app_instance.card.mcp_endpoint)
-        return AppToolsResponse(tools=[ToolInfo(**tool) for tool in tools])
+        # Tools are already normalized by get_app_tools
+        return _json_response({"tools": tools})
     except Exception as e:
         logger.error(
-            f"Failed to get tools from app {app_id}: {e}, endpoint: {app_instance.card.mcp_endpoint}"
+            "Failed to get tools from app %s: %s, endpoint: %s",
+            app_id,
+            e,
+            app_instance.card.mcp_endpoint,
         )
         raise HTTPException(
             status_code=503, detail=f"Failed to connect to app MCP endpoint: {str(e)}"
@@ -357,7 +405,7 @@ async def get_app_tools_endpoint(app_id: str) -> AppToolsResponse:
 
 # Task endpoints
 @app.post("/tasks", response_model=Task)
-async def create_task(request: CreateTaskRequest) -> Task:
+async def create_task(request: CreateTaskRequest) -> Response:
     """Create a new task."""
     task = Task(
         status=TaskStatus(state=TaskState.SUBMITTED),
@@ -368,7 +416,32 @@ async def create_task(request: CreateTaskRequest) -> Task:
     if request.initial_message:
         task.history.append(request.initial_message)
 
-    return store.create_task(task)
+    return _json_response(store.create_task(task))
+
+
+def _encode_page_token(cursor: tuple[float, str]) -> str:
+    """Encode a (position, task_id) cursor as an opaque page token."""
+    return base64.urlsafe_b64encode(_json.dumps(list(cursor))).decode().rstrip("=")
+
+
+def _decode_page_token(token: str) -> tuple[float, str]:
+    """Decode a page token back to its (position, task_id) cursor.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        position, task_id = _json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid page token: {token}") from e
+    if (
+        not isinstance(position, int | float)
+        or isinstance(position, bool)
+        or not isinstance(task_id, str)
+    ):
+        raise ValueError(f"Invalid page token: {token}")
+    return position, task_id
 
 
 @app.get("/tasks", response_model=TaskListResponse)
@@ -377,24 +450,37 @@ async def list_tasks(
     status: TaskState | None = Query(None),
     page_size: int = Query(50, ge=1, le=100),
     page_token: str = Query(""),
-) -> TaskListResponse:
-    """List tasks with optional filtering."""
-    offset = int(page_token) if page_token else 0
-    tasks, total = store.list_tasks(
-        context_id=context_id,
-        status=status,
-        limit=page_size,
-        offset=offset,
-    )
+) -> Response:
+    """List tasks with optional filtering.
 
-    next_offset = offset + page_size
-    next_token = str(next_offset) if next_offset < total else ""
-
-    return TaskListResponse(
-        tasks=tasks,
-        total=total,
-        page_size=page_size,
-        next_page_token=next_token,
+    Pages are resumed from an opaque cursor on the last task's creation
+    position, so each page costs O(page_size) however deep it is, and the
+    cursor stays valid if that task is deleted.
+    """
+    try:
+        after = _decode_page_token(page_token) if page_token else None
+        # Fetch one extra task to learn whether another page exists
+        tasks, total, cursors = store.list_tasks(
+            context_id=context_id,
+            status=status,
+            limit=page_size + 1,
+            after=after,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid page_token")
+
+    next_token = ""
+    if len(tasks) > page_size:
+        tasks = tasks[:page_size]
+        next_token = _encode_page_token(cursors[page_size - 1])
+
+    return _json_response(
+        {
+            "tasks": [task.model_dump(mode="json") for task in tasks],
+            "total": total,
+            "page_size": page_size,
+            "next_page_token": next_token,
+        }
     )
 
 
@@ -402,17 +488,20 @@ async def list_tasks(
 async def get_task(
     task_id: str,
     history_length: int | None = Query(None),
-) -> Task:
+) -> Response:
     """Get a task by ID."""
     task = store.get_task(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
+    # Dump only the requested history tail instead of copying the whole task
+    data = task.model_dump(mode="json", exclude={"history"})
+    history = task.history
     if history_length is not None:
-        task = task.model_copy()
-        task.history = task.history[-history_length:]
+        history = history[max(len(history) - history_length, 0) :]
+    data["history"] = [message.model_dump(mode="json") for message in history]
 
-    return task
+    return _json_response(data)
 
 
 @app.delete("/tasks/{task_id}")
@@ -424,12 +513,12 @@ async def delete_task(task_id: str) -> dict:
 
 
 @app.post("/tasks/{task_id}/cancel", response_model=Task)
-async def cancel_task(task_id: str) -> Task:
+async def cancel_task(task_id: str) -> Response:
     """Cancel a task."""
     task = store.cancel_task(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    return task
+    return _json_response(task)
 
 
 # Frontend static files
@@ -442,23 +531,70 @@ if FRONTEND_DIR.exists():
         app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="static")
 
 
+_INDEX_PATH = FRONTEND_DIR / "index.html"
+# Dashboard index as ((mtime_ns, size), etag, body); re-read when the file changes
+_index_cache: tuple[tuple[int, int], str, bytes] | None = None
+
+
+def _load_index() -> tuple[str, bytes] | None:
+    """Get the dashboard index's ETag and body, or None if it is not built."""
+    global _index_cache
+    try:
+        stat = _INDEX_PATH.stat()
+    except FileNotFoundError:
+        return None
+    version = (stat.st_mtime_ns, stat.st_size)
+    if _index_cache is None or _index_cache[0] != version:
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        _index_cache = (version, etag, _INDEX_PATH.read_bytes())
+    return _index_cache[1], _index_cache[2]
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Check an If-None-Match header against an ETag, ignoring weak prefixes."""
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
 @app.get("/")
-async def serve_frontend():
-    """Serve the frontend dashboard."""
-    index_path = FRONTEND_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
-    raise HTTPException(
-        status_code=404,
-        detail="Frontend not found. Run 'npm run build' in the frontend directory.",
-    )
+async def serve_frontend(request: Request) -> Response:
+    """Serve the frontend dashboard, answering revalidations with 304."""
+    index = _load_index()
+    if index is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Frontend not found. Run 'npm run build' in the frontend directory.",
+        )
+    etag, body = index
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
+
+
+def uvicorn_options() -> dict:
+    """Pick the fastest uvicorn loop and HTTP parser available.
+
+    uvloop and httptools ship with uvicorn[standard]; uvloop is not available
+    on Windows, so fall back to the pure-Python implementations when either
+    is missing.
+    """
+    from importlib.util import find_spec
+
+    use_uvloop = sys.platform != "win32" and find_spec("uvloop") is not None
+    return {
+        "loop": "uvloop" if use_uvloop else "asyncio",
+        "http": "httptools" if find_spec("httptools") is not None else "h11",
+        "access_log": THRONGLETS_ACCESS_LOG,
+    }
 
 
 def run_http_server(host: str = "0.0.0.0", port: int = 8000) -> None:
     """Run the HTTP server."""
     import uvicorn
 
-    uvicorn.run(app, host=host, port=port)
+    uvicorn.run(app, host=host, port=port, **uvicorn_options())
 
 
 if __name__ == "__main__":
@@ -46,9 +46,9 @@ def main() -> None:
 
     import uvicorn
 
-    from thronglets.http_api import app
+    from thronglets.http_api import app, uvicorn_options
 
-    uvicorn.run(app, host=args.host, port=args.port)
+    uvicorn.run(app, host=args.host, port=args.port, **uvicorn_options())
 
 
 if __name__ == "__main__":
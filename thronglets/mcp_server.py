@@ -1,24 +1,170 @@
 """MCP Server for agent-to-agent communication."""
 
+import asyncio
+import itertools
+import json
+import time
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
 from datetime import datetime
 
+import httpx
 from fastapi.logger import logger
 from fastmcp import Context, FastMCP
+from fastmcp.server.dependencies import get_http_headers
 
+from thronglets import _json
+from thronglets.app_registry import app_registry
 from thronglets.auth import get_auth_provider
+from thronglets.dynamic_mcp import (
+    get_app_tools,
+    get_cached_tools,
+    get_client,
+    read_first_sse_data,
+)
 from thronglets.models import (
+    TERMINAL_TASK_STATES,
+    BatchMessage,
     InternalMessage,
     Message,
     Part,
+    RegisteredAgent,
+    RegisteredApp,
     Role,
     Task,
     TaskState,
     TaskStatus,
 )
-from thronglets.store import store
+from thronglets.store import LIST_CACHE_MAX_AGE, store
 
 # Header key for agent ID
 AGENT_ID_HEADER = "X-Agent-ID"
+_AGENT_ID_HEADER_LOWER = AGENT_ID_HEADER.lower()
+# Request metadata keys that may carry the agent ID, in lookup order
+_META_AGENT_ID_KEYS = (AGENT_ID_HEADER, "agent_id")
+
+_MISSING = object()
+# (request context, memo) for the MCP request being handled
+_request_memo_var: ContextVar[tuple[object, dict] | None] = ContextVar(
+    "thronglets_request_memo", default=None
+)
+
+# Concurrent tools/list requests made by app__list(include_tools=True)
+_TOOL_DISCOVERY_CONCURRENCY = 16
+
+# Task status strings accepted by the task tools, and the error for others
+_TASK_STATE_BY_VALUE: dict[str, TaskState] = {s.value: s for s in TaskState}
+_VALID_STATE_VALUES = tuple(_TASK_STATE_BY_VALUE)
+
+
+def _invalid_status_error(status: str) -> dict:
+    """Build the error payload for an unknown task status string."""
+    return {
+        "status": "error",
+        "error": f"Invalid status '{status}'. Valid values: {list(_VALID_STATE_VALUES)}",
+    }
+
+
+# Fields dumped by the listing tools. Nested "card"/"status" sections are
+# flattened into the summary after pydantic serializes them in one pass.
+_AGENT_SUMMARY = {
+    "agent_id": True,
+    "registered_at": True,
+    "card": {
+        "name": True,
+        "description": True,
+        "version": True,
+        "skills": {"__all__": {"id", "name", "description", "tags"}},
+        "supported_interfaces": {"__all__": {"url", "protocol_binding"}},
+    },
+}
+_TASK_SUMMARY = {
+    "id": True,
+    "context_id": True,
+    "metadata": True,
+    "status": {"state", "timestamp"},
+}
+_APP_SUMMARY = {
+    "app_id": True,
+    "healthy": True,
+    "registered_at": True,
+    "card": {
+        "name",
+        "description",
+        "scenario",
+        "mcp_endpoint",
+        "health_check_url",
+        "icon_url",
+        "tags",
+    },
+}
+
+# Listing summaries keyed by tool, as (source version, monotonic timestamp,
+# summaries). Reused while the source's version is unchanged and for at most
+# LIST_CACHE_MAX_AGE, which bounds staleness from writes by other processes.
+_summary_cache: dict[object, tuple[int, float, list]] = {}
+
+
+def _cached_summaries(key: object, version: int, build: Callable[[], list]) -> list:
+    """Get listing summaries from the cache, rebuilding them when stale."""
+    now = time.monotonic()
+    cached = _summary_cache.get(key)
+    if cached and cached[0] == version and now - cached[1] < LIST_CACHE_MAX_AGE:
+        return cached[2]
+    summaries = build()
+    _summary_cache[key] = (version, now, summaries)
+    return summaries
+
+
+def _agent_summary(agent: RegisteredAgent) -> dict:
+    """Summarize an agent for agent__list (without the per-caller is_self)."""
+    info = agent.model_dump(mode="json", include=_AGENT_SUMMARY)
+    info.update(info.pop("card"))
+    return info
+
+
+def _app_summary(app: RegisteredApp) -> dict:
+    """Summarize an app for app__list (without tool info)."""
+    info = app.model_dump(mode="json", include=_APP_SUMMARY)
+    info.update(info.pop("card"))
+    return info
+
+
+def _message_text(message: Message) -> str | None:
+    """Get the text of a message's first part, or None if it has none."""
+    parts = message.parts
+    return (parts[0].text or None) if parts else None
+
+
+# Per-field extractors for the ``fields`` projection of task__list/task__get;
+# task__get additionally accepts "history" and "artifacts"
+_TASK_FIELDS: dict[str, Callable[[Task], object]] = {
+    "id": lambda task: task.id,
+    "context_id": lambda task: task.context_id,
+    "state": lambda task: task.status.state,
+    "timestamp": lambda task: task.status.timestamp,
+    "metadata": lambda task: task.metadata,
+}
+_TASK_GET_FIELDS = frozenset({*_TASK_FIELDS, "history", "artifacts"})
+
+
+def _invalid_fields_error(fields: list[str], valid: Iterable[str]) -> dict | None:
+    """Build the error payload if ``fields`` names unknown task fields."""
+    unknown = [field for field in fields if field not in valid]
+    if not unknown:
+        return None
+    return {
+        "status": "error",
+        "error": f"Unknown fields {unknown}. Valid fields: {sorted(valid)}",
+    }
+
+
+def _task_summary(task: Task) -> dict:
+    """Summarize a task for task__list."""
+    info = task.model_dump(include=_TASK_SUMMARY)
+    info.update(info.pop("status"))
+    return info
+
 
 # Get auth provider (None if auth is disabled)
 auth_provider = get_auth_provider()
@@ -30,23 +176,84 @@ mcp = FastMCP(
 )
 
 
+def _request_memo(ctx: Context) -> dict:
+    """Get the memo dict for the MCP request behind ``ctx``.
+
+    The memo is tagged with the request context it was created for, so a
+    value never outlives its request even if the context variable does.
+    """
+    request_context = ctx.request_context
+    if request_context is None:
+        return {}
+    current = _request_memo_var.get()
+    if current is not None and current[0] is request_context:
+        return current[1]
+    memo: dict = {}
+    _request_memo_var.set((request_context, memo))
+    return memo
+
+
+def _request_headers(memo: dict) -> dict:
+    """Get the current request's HTTP headers, read once per request."""
+    headers = memo.get("headers")
+    if headers is None:
+        raw = get_http_headers()
+        # get_http_headers already builds a fresh dict; only copy other mappings
+        if not raw:
+            headers = {}
+        elif isinstance(raw, dict):
+            headers = raw
+        else:
+            headers = dict(raw)
+        memo["headers"] = headers
+    return headers
+
+
+def _request_metadata(ctx: Context, memo: dict) -> dict:
+    """Get the current request's MCP metadata as a dict, once per request."""
+    metadata = memo.get("metadata")
+    if metadata is None:
+        metadata = {}
+        meta = getattr(ctx.request_context, "meta", None)
+        if meta:
+            if hasattr(meta, "items"):
+                metadata = dict(meta)
+            elif hasattr(meta, "__dict__"):
+                metadata = {
+                    k: v for k, v in vars(meta).items() if not k.startswith("_")
+                }
+        memo["metadata"] = metadata
+    return metadata
+
+
 def get_agent_id_from_context(ctx: Context) -> str | None:
     """Extract agent_id from MCP context metadata."""
-    if ctx.request_context and ctx.request_context.meta:
-        meta = ctx.request_context.meta
-        if hasattr(meta, "get"):
-            return meta.get(AGENT_ID_HEADER) or meta.get("agent_id")
-        if hasattr(meta, AGENT_ID_HEADER):
-            return getattr(meta, AGENT_ID_HEADER)
-        if hasattr(meta, "agent_id"):
-            return getattr(meta, "agent_id")
-    from fastmcp.server.dependencies import get_http_headers
-
-    headers = get_http_headers()
-    if headers and AGENT_ID_HEADER in headers:
+    memo = _request_memo(ctx)
+    agent_id = memo.get("agent_id", _MISSING)
+    if agent_id is _MISSING:
+        agent_id = memo["agent_id"] = _resolve_agent_id(ctx, memo)
+    return agent_id
+
+
+def _resolve_agent_id(ctx: Context, memo: dict) -> str | None:
+    """Resolve agent_id from request metadata, falling back to HTTP headers."""
+    meta = getattr(ctx.request_context, "meta", None)
+    if meta is not None:
+        get = getattr(meta, "get", None)
+        if get is not None:
+            for key in _META_AGENT_ID_KEYS:
+                if value := get(key):
+                    return value
+        else:
+            for key in _META_AGENT_ID_KEYS:
+                if value := getattr(meta, key, None):
+                    return value
+
+    headers = _request_headers(memo)
+    if AGENT_ID_HEADER in headers:
         return headers[AGENT_ID_HEADER]
-    if headers and AGENT_ID_HEADER.lower() in headers:
-        return headers[AGENT_ID_HEADER.lower()]
+    if _AGENT_ID_HEADER_LOWER in headers:
+        return headers[_AGENT_ID_HEADER_LOWER]
     return None
 
 
@@ -59,38 +266,20 @@ def agent__list(ctx: Context) -> dict:
 
     Returns a list of all agents with their IDs, names, descriptions, and capabilities.
     """
-    agents = store.list_agents()
     current_agent_id = get_agent_id_from_context(ctx)
+    summaries = _cached_summaries(
+        "agents",
+        store.agents_version,
+        lambda: [_agent_summary(agent) for agent in store.list_agents()],
+    )
     return {
         "current_agent_id": current_agent_id,
+        # is_self is the only per-caller field, so patch it onto shallow copies
         "agents": [
-            {
-                "agent_id": agent.agent_id,
-                "name": agent.card.name,
-                "description": agent.card.description,
-                "version": agent.card.version,
-                "is_self": agent.agent_id == current_agent_id,
-                "skills": [
-                    {
-                        "id": skill.id,
-                        "name": skill.name,
-                        "description": skill.description,
-                        "tags": skill.tags,
-                    }
-                    for skill in agent.card.skills
-                ],
-                "supported_interfaces": [
-                    {
-                        "url": iface.url,
-                        "protocol_binding": iface.protocol_binding,
-                    }
-                    for iface in agent.card.supported_interfaces
-                ],
-                "registered_at": agent.registered_at.isoformat(),
-            }
-            for agent in agents
+            {**info, "is_self": info["agent_id"] == current_agent_id}
+            for info in summaries
         ],
-        "total": len(agents),
+        "total": len(summaries),
     }
 
 
@@ -128,7 +317,7 @@ def agent__whoami(ctx: Context) -> dict:
 
 
 @mcp.tool()
-def message__send(
+async def message__send(
     ctx: Context,
     to_agent_id: str,
     content: str,
@@ -150,7 +339,7 @@ def message__send(
     """
     from_agent_id = get_agent_id_from_context(ctx)
 
-    target_agent = store.get_agent(to_agent_id)
+    target_agent = await store.get_agent_async(to_agent_id)
     if not target_agent:
         return {
             "status": "error",
@@ -169,14 +358,11 @@ def message__send(
         to_agent_id=to_agent_id,
         message=message,
     )
-    store.send_message(internal_msg)
+    await store.send_message_async(internal_msg)
     logger.info(f"SENT <{from_agent_id} -> {to_agent_id}> :{content}")
 
     if task_id:
-        task = store.get_task(task_id)
-        if task:
-            task.history.append(message)
-            store.update_task(task)
+        await store.append_task_history_async(task_id, [message])
 
     return {
         "status": "sent",
@@ -189,6 +375,80 @@ def message__send(
     }
 
 
+@mcp.tool()
+def message__send_batch(ctx: Context, messages: list[BatchMessage]) -> dict:
+    """Send several messages to other agents in one call.
+
+    The sender agent ID is automatically determined from the X-Agent-ID header.
+    Messages to unknown agents are reported as errors; the rest are sent.
+
+    Args:
+        messages: Messages to send, each with a target agent ID and content,
+            and optionally a task ID and context ID.
+
+    Returns:
+        Per-message delivery status, in the order given.
+    """
+    from_agent_id = get_agent_id_from_context(ctx)
+
+    targets = store.get_agents(list({m.to_agent_id for m in messages}))
+
+    results = []
+    outgoing: list[InternalMessage] = []
+    history_by_task: dict[str, list[Message]] = {}
+    for item in messages:
+        to_agent_id = item.to_agent_id
+        target_agent = targets.get(to_agent_id)
+        if not target_agent:
+            results.append(
+                {
+                    "status": "error",
+                    "error": f"Agent with ID '{to_agent_id}' not found",
+                }
+            )
+            continue
+
+        task_id = item.task_id
+        message = Message(
+            role=Role.AGENT,
+            parts=[Part(text=item.content)],
+            task_id=task_id,
+            context_id=item.context_id,
+        )
+        internal_msg = InternalMessage(
+            from_agent_id=from_agent_id,
+            to_agent_id=to_agent_id,
+            message=message,
+        )
+        outgoing.append(internal_msg)
+        if task_id:
+            history_by_task.setdefault(task_id, []).append(message)
+        results.append(
+            {
+                "status": "sent",
+                "message_id": internal_msg.id,
+                "to_agent": {
+                    "id": target_agent.agent_id,
+                    "name": target_agent.card.name,
+                },
+            }
+        )
+
+    store.send_messages(outgoing)
+    logger.info(f"SENT <{from_agent_id}> batch of {len(outgoing)} messages")
+
+    # One history append per task rather than per message
+    for task_id, history in history_by_task.items():
+        store.append_task_history(task_id, history)
+
+    return {
+        "status": "ok",
+        "from_agent_id": from_agent_id,
+        "sent": len(outgoing),
+        "results": results,
+    }
+
+
 @mcp.tool()
 def message__receive(
     ctx: Context,
@@ -227,7 +487,7 @@ def message__receive(
     )
     if len(messages) > 0:
         logger.info(
-            f"RECEIVED <{messages[0].from_agent_id} -> {agent_id}> :{messages[0].message.parts[0].text}"
+            f"RECEIVED <{messages[0].from_agent_id} -> {agent_id}> :{_message_text(messages[0].message)}"
         )
 
     return {
@@ -237,14 +497,11 @@ def message__receive(
             {
                 "id": msg.id,
                 "from_agent_id": msg.from_agent_id,
-                "content": (
-                    msg.message.parts[0].text
-                    if msg.message.parts and msg.message.parts[0].text
-                    else None
-                ),
+                "content": _message_text(msg.message),
                 "task_id": msg.message.task_id,
                 "context_id": msg.message.context_id,
-                "created_at": msg.created_at.isoformat(),
+                # Left as datetime: the MCP JSON encoder formats it natively
+                "created_at": msg.created_at,
             }
             for msg in messages
         ],
@@ -301,7 +558,7 @@ def task__create(
         "task": {
             "id": created_task.id,
             "context_id": created_task.context_id,
-            "state": created_task.status.state.value,
+            "state": created_task.status.state,
             "created_at": created_task.status.timestamp.isoformat(),
             "metadata": created_task.metadata,
         },
@@ -313,16 +570,24 @@ def task__get(
     ctx: Context,
     task_id: str,
     history_length: int | None = None,
+    fields: list[str] | None = None,
 ) -> dict:
     """Get a task by ID.
 
     Args:
         task_id: The ID of the task to retrieve.
         history_length: Optional limit on number of history messages to return.
+        fields: Optional task fields to return (id, context_id, state,
+            timestamp, metadata, history, artifacts); all when omitted.
 
     Returns:
         The task details.
     """
+    if fields is not None and (
+        error := _invalid_fields_error(fields, _TASK_GET_FIELDS)
+    ):
+        return error
+
     task = store.get_task(task_id)
     if not task:
         return {
@@ -330,37 +595,38 @@ def task__get(
             "error": f"Task with ID '{task_id}' not found",
         }
 
-    history = task.history
-    if history_length is not None:
-        history = history[-history_length:]
+    wanted = _TASK_GET_FIELDS if fields is None else frozenset(fields)
+    task_info = {
+        name: get(task) for name, get in _TASK_FIELDS.items() if name in wanted
+    }
+
+    if "history" in wanted:
+        history = task.history
+        if history_length is not None:
+            # max() keeps history_length=0 from slicing the whole list
+            history = history[max(len(history) - history_length, 0) :]
+        task_info["history"] = [
+            {
+                "message_id": msg.message_id,
+                "role": msg.role,
+                "content": _message_text(msg),
+            }
+            for msg in history
+        ]
+
+    if "artifacts" in wanted:
+        task_info["artifacts"] = [
+            {
+                "artifact_id": art.artifact_id,
+                "name": art.name,
+                "description": art.description,
+            }
+            for art in task.artifacts
+        ]
 
     return {
         "status": "ok",
-        "task": {
-            "id": task.id,
-            "context_id": task.context_id,
-            "state": task.status.state.value,
-            "timestamp": task.status.timestamp.isoformat(),
-            "metadata": task.metadata,
-            "history": [
-                {
-                    "message_id": msg.message_id,
-                    "role": msg.role.value,
-                    "content": (
-                        msg.parts[0].text if msg.parts and msg.parts[0].text else None
-                    ),
-                }
-                for msg in history
-            ],
-            "artifacts": [
-                {
-                    "artifact_id": art.artifact_id,
-                    "name": art.name,
-                    "description": art.description,
-                }
-                for art in task.artifacts
-            ],
-        },
+        "task": task_info,
     }
 
 
@@ -370,6 +636,7 @@ def task__list(
     context_id: str | None = None,
     status: str | None = None,
     limit: int = 50,
+    fields: list[str] | None = None,
 ) -> dict:
     """List tasks with optional filtering.
 
@@ -377,39 +644,40 @@ def task__list(
         context_id: Optional filter by context ID.
         status: Optional filter by task state (submitted, working, completed, failed, cancelled).
         limit: Maximum number of tasks to return (default: 50).
+        fields: Optional task fields to return per task (id, context_id,
+            state, timestamp, metadata); all when omitted.
 
     Returns:
         List of tasks.
     """
+    if fields is not None and (error := _invalid_fields_error(fields, _TASK_FIELDS)):
+        return error
+
     task_state = None
     if status:
-        try:
-            task_state = TaskState(status)
-        except ValueError:
-            return {
-                "status": "error",
-                "error": f"Invalid status '{status}'. Valid values: {[s.value for s in TaskState]}",
-            }
+        task_state = _TASK_STATE_BY_VALUE.get(status)
+        if task_state is None:
+            return _invalid_status_error(status)
 
-    tasks, total = store.list_tasks(
+    tasks, total, _ = store.list_tasks(
         context_id=context_id,
         status=task_state,
         limit=limit,
         offset=0,
     )
 
+    if fields is None:
+        result_tasks = [_task_summary(task) for task in tasks]
+    else:
+        # Resolve the extractors once, then apply them per row
+        extractors = [(field, _TASK_FIELDS[field]) for field in fields]
+        result_tasks = [
+            {field: get(task) for field, get in extractors} for task in tasks
+        ]
+
     return {
         "status": "ok",
-        "tasks": [
-            {
-                "id": task.id,
-                "context_id": task.context_id,
-                "state": task.status.state.value,
-                "timestamp": task.status.timestamp.isoformat(),
-                "metadata": task.metadata,
-            }
-            for task in tasks
-        ],
+        "tasks": result_tasks,
         "total": total,
     }
 
@@ -440,22 +708,12 @@ def task__update_status(
             "error": f"Task with ID '{task_id}' not found",
         }
 
-    try:
-        new_state = TaskState(status)
-    except ValueError:
-        return {
-            "status": "error",
-            "error": f"Invalid status '{status}'. Valid values: {[s.value for s in TaskState]}",
-        }
+    new_state = _TASK_STATE_BY_VALUE.get(status)
+    if new_state is None:
+        return _invalid_status_error(status)
 
     # Don't allow updating terminal states
-    terminal_states = {
-        TaskState.COMPLETED,
-        TaskState.FAILED,
-        TaskState.CANCELLED,
-        TaskState.REJECTED,
-    }
-    if task.status.state in terminal_states:
+    if task.status.state in TERMINAL_TASK_STATES:
         return {
             "status": "error",
             "error": f"Cannot update task in terminal state '{task.status.state.value}'",
@@ -471,7 +729,7 @@ def task__update_status(
         )
         task.history.append(status_message)
 
-    task.status = TaskStatus(
+    task.status = TaskStatus.model_construct(
         state=new_state,
         message=status_message,
         timestamp=datetime.now(),
@@ -483,7 +741,7 @@ def task__update_status(
         "status": "updated",
         "task": {
             "id": task.id,
-            "state": task.status.state.value,
+            "state": task.status.state,
             "timestamp": task.status.timestamp.isoformat(),
         },
     }
@@ -510,7 +768,7 @@ def task__cancel(ctx: Context, task_id: str) -> dict:
         "status": "cancelled",
         "task": {
             "id": task.id,
-            "state": task.status.state.value,
+            "state": task.status.state,
             "timestamp": task.status.timestamp.isoformat(),
         },
     }
@@ -537,43 +795,56 @@ async def app__list(
     Returns a list of all registered Apps with their names, scenarios,
     descriptions, MCP endpoints, and optionally their tools.
     """
-    from thronglets.app_registry import app_registry
-    from thronglets.dynamic_mcp import _tools_cache, get_app_tools
+    summaries = _cached_summaries(
+        ("apps", healthy_only),
+        app_registry.version,
+        lambda: [
+            (app, _app_summary(app))
+            for app in app_registry.list(healthy_only=healthy_only)
+        ],
+    )
+    # Discover uncached tools for all healthy apps concurrently, so the call
+    # takes about one App round-trip instead of one per App
+    fetched: dict[str, list[dict] | None] = {}
+    if include_tools:
+        to_fetch = [
+            app
+            for app, _ in summaries
+            if app.healthy and get_cached_tools(app.app_id) is None
+        ]
+        if to_fetch:
+            semaphore = asyncio.Semaphore(_TOOL_DISCOVERY_CONCURRENCY)
+
+            async def _fetch(app: RegisteredApp) -> list[dict] | None:
+                async with semaphore:
+                    try:
+                        return await get_app_tools(app.app_id, app.card.mcp_endpoint)
+                    except Exception as e:
+                        logger.warning(f"Failed to get tools for app {app.app_id}: {e}")
+                        return None
+
+            results = await asyncio.gather(*(_fetch(app) for app in to_fetch))
+            fetched = {app.app_id: tools for app, tools in zip(to_fetch, results)}
 
-    apps = app_registry.list(healthy_only=healthy_only)
     result_apps = []
 
-    for app in apps:
-        app_info = {
-            "app_id": app.app_id,
-            "name": app.card.name,
-            "description": app.card.description,
-            "scenario": app.card.scenario,
-            "mcp_endpoint": app.card.mcp_endpoint,
-            "health_check_url": app.card.health_check_url,
-            "icon_url": app.card.icon_url,
-            "tags": app.card.tags,
-            "healthy": app.healthy,
-            "registered_at": app.registered_at.isoformat(),
-        }
+    # Tool info follows the tools cache rather than the registry, so it is
+    # added per call on top of a copy of the cached summary
+    for app, summary in summaries:
+        app_info = dict(summary)
 
         # Add tools_count from cache if available
-        if app.app_id in _tools_cache:
-            _, cached_tools = _tools_cache[app.app_id]
-            app_info["tools_count"] = len(cached_tools)
+        tools = fetched.get(app.app_id)
+        if tools is None:
+            tools = get_cached_tools(app.app_id)
+        if tools is not None:
+            app_info["tools_count"] = len(tools)
             if include_tools:
-                app_info["tools"] = cached_tools
+                app_info["tools"] = tools
         else:
             app_info["tools_count"] = None  # Not yet discovered
-            if include_tools and app.healthy:
-                # Fetch tools if requested
-                try:
-                    tools = await get_app_tools(app.app_id, app.card.mcp_endpoint)
-                    app_info["tools_count"] = len(tools)
-                    app_info["tools"] = tools
-                except Exception as e:
-                    logger.warning(f"Failed to get tools for app {app.app_id}: {e}")
-                    app_info["tools"] = []
+            if app.app_id in fetched:
+                app_info["tools"] = []  # Discovery failed
 
         result_apps.append(app_info)
 
@@ -593,8 +864,6 @@ def app__get(ctx: Context, app_id: str) -> dict:
     Returns:
         The App details including MCP endpoint and health status.
     """
-    from thronglets.app_registry import app_registry
-
     app = app_registry.get(app_id)
     if not app:
         return {
@@ -633,9 +902,6 @@ async def app__list_tools(ctx: Context, app_id: str) -> dict:
     Returns:
         List of tools with name, description, and inputSchema.
     """
-    from thronglets.app_registry import app_registry
-    from thronglets.dynamic_mcp import get_app_tools
-
     app = app_registry.get(app_id)
     if not app:
         return {
@@ -668,6 +934,40 @@ async def app__list_tools(ctx: Context, app_id: str) -> dict:
         }
 
 
+# app__execute MCP sessions per (agent_id, app_id), as (monotonic start, id),
+# so each Agent-App pair keeps its own isolated session across calls
+_execute_sessions: dict[tuple[str, str], tuple[float, str]] = {}
+_EXECUTE_SESSION_TTL = 600.0  # 10 minutes
+_EXECUTE_SESSION_MAXSIZE = 4096
+
+# tools/call statuses meaning the App no longer knows a reused session (MCP
+# answers 404 for expired sessions); other failures are not retried, so a
+# tool that errored is never executed twice
+_STALE_SESSION_STATUSES = frozenset({400, 401, 404})
+
+# JSON-RPC IDs must be unique within a session now that sessions are reused
+_execute_request_ids = itertools.count(2)
+
+_EXECUTE_INIT_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-11-25",
+        "capabilities": {},
+        "clientInfo": {
+            "name": "Thronglets ServiceBus",
+            "version": "0.1.0",
+        },
+    },
+}
+
+# Request headers never forwarded to Apps by app__execute
+_HOP_BY_HOP_HEADERS = frozenset(
+    {"host", "content-length", "transfer-encoding", "connection"}
+)
+
+
 @mcp.tool()
 async def app__execute(
     ctx: Context,
@@ -689,8 +989,6 @@ async def app__execute(
     Returns:
         The tool execution result.
     """
-    from thronglets.app_registry import app_registry
-
     agent_id = get_agent_id_from_context(ctx)
     if not agent_id:
         return {
@@ -712,34 +1010,21 @@ async def app__execute(
         }
 
     try:
-        import asyncio
-        import json
-
-        import httpx
-
         # Extract agent context for passing to App
         agent_context = _extract_agent_context(ctx)
         mcp_endpoint = app.card.mcp_endpoint
 
         async with asyncio.timeout(30.0):
-            # Start with required MCP headers
+            # The shared client already sends the required MCP Accept and
+            # Content-Type headers; pass through ALL original user headers
+            # except those that might conflict with MCP protocol
+            original_headers = agent_context.get("headers", {})
             headers = {
-                "Accept": "application/json, text/event-stream",
-                "Content-Type": "application/json",
+                key: value
+                for key, value in original_headers.items()
+                if key.lower() not in _HOP_BY_HOP_HEADERS
             }
 
-            # Pass through ALL original user headers from the request
-            original_headers = agent_context.get("headers", {})
-            for key, value in original_headers.items():
-                # Skip headers that might conflict with MCP protocol
-                if key.lower() not in [
-                    "host",
-                    "content-length",
-                    "transfer-encoding",
-                    "connection",
-                ]:
-                    headers[key] = value
-
             # Ensure X-Agent-ID is set
             if agent_context.get("agent_id"):
                 headers["X-Agent-ID"] = agent_context["agent_id"]
@@ -749,124 +1034,103 @@ async def app__execute(
             if original_metadata:
                 headers["X-MCP-Metadata"] = json.dumps(original_metadata)
 
-            async with httpx.AsyncClient(headers=headers, timeout=30.0) as client:
-                # Initialize MCP session
-                init_request = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "initialize",
-                    "params": {
-                        "protocolVersion": "2025-11-25",
-                        "capabilities": {},
-                        "clientInfo": {
-                            "name": "Thronglets ServiceBus",
-                            "version": "0.1.0",
-                        },
-                    },
-                }
+            # Shared HTTP/2 client: concurrent calls to the same App host are
+            # multiplexed over one connection instead of opening one each
+            client = get_client()
+
+            # Reuse this Agent-App pair's session when one is cached, skipping
+            # the initialize round-trip
+            session_key = (agent_id, app_id)
+            session_id, reused_session, error = await _get_execute_session(
+                client, session_key, mcp_endpoint, headers
+            )
+            if error:
+                return {"status": "error", "error": error}
+
+            # Call the tool
+            tool_request = {
+                "jsonrpc": "2.0",
+                "id": next(_execute_request_ids),
+                "method": "tools/call",
+                "params": {
+                    "name": tool_name,
+                    "arguments": arguments or {},
+                },
+            }
 
-                response = await client.post(mcp_endpoint, json=init_request)
-                if response.status_code != 200:
-                    return {
-                        "status": "error",
-                        "error": f"Failed to initialize MCP session: {response.status_code}",
-                    }
-
-                session_id = response.headers.get(
-                    "mcp-session-id"
-                ) or response.headers.get("x-session-id")
-                if not session_id:
-                    return {
-                        "status": "error",
-                        "error": "No session ID found in MCP response",
-                    }
-
-                # Call the tool
-                tool_request = {
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "tools/call",
-                    "params": {
-                        "name": tool_name,
-                        "arguments": arguments or {},
-                    },
-                }
+            # Headers are built once per call; only the session ID is set on them
+            headers["mcp-session-id"] = session_id
 
-                session_headers = headers.copy()
-                session_headers["mcp-session-id"] = session_id
+            status_code, tool_json_data = await _call_execute_tool(
+                client, mcp_endpoint, tool_request, headers
+            )
 
-                tool_response = await client.post(
-                    mcp_endpoint, json=tool_request, headers=session_headers
+            if status_code in _STALE_SESSION_STATUSES and reused_session:
+                # The App dropped the cached session; retry once on a fresh one
+                _execute_sessions.pop(session_key, None)
+                del headers["mcp-session-id"]
+                session_id, _, error = await _get_execute_session(
+                    client, session_key, mcp_endpoint, headers
+                )
+                if error:
+                    return {"status": "error", "error": error}
+                headers["mcp-session-id"] = session_id
+                status_code, tool_json_data = await _call_execute_tool(
+                    client, mcp_endpoint, tool_request, headers
                 )
 
-                if tool_response.status_code != 200:
-                    return {
-                        "status": "error",
-                        "error": f"Tool execution failed: {tool_response.status_code}",
-                    }
-
-                # Parse SSE response
-                tool_content = tool_response.text
-                if "data: " not in tool_content:
-                    return {
-                        "status": "error",
-                        "error": "Invalid SSE response format",
-                    }
-
-                # SSE format: "event: message\ndata: {...}\n\n"
-                # Extract only the first JSON data line
-                tool_json_data = None
-                for line in tool_content.split("\n"):
-                    line = line.strip()
-                    if line.startswith("data: "):
-                        tool_json_data = line[6:]  # Remove "data: " prefix
-                        break
-
-                if not tool_json_data:
-                    return {
-                        "status": "error",
-                        "error": "No data found in SSE response",
-                    }
-
-                tool_result = json.loads(tool_json_data)
-
-                # Check for JSON-RPC error
-                if "error" in tool_result:
-                    return {
-                        "status": "error",
-                        "error": tool_result["error"].get("message", "Unknown error"),
-                    }
-
-                result_data = tool_result.get("result", {})
-                content_items = []
-
-                # Process content from result
-                for content in result_data.get("content", []):
-                    if content.get("type") == "text":
-                        content_items.append(
-                            {"type": "text", "text": content.get("text", "")}
-                        )
-                    elif content.get("type") == "image":
-                        content_items.append(
-                            {"type": "image", "data": content.get("data", "")}
-                        )
-                    else:
-                        content_items.append(
-                            {
-                                "type": content.get("type", "unknown"),
-                                "raw": str(content),
-                            }
-                        )
+            if status_code != 200:
+                return {
+                    "status": "error",
+                    "error": f"Tool execution failed: {status_code}",
+                }
+
+            if tool_json_data is None:
+                return {
+                    "status": "error",
+                    "error": "Invalid SSE response format",
+                }
+            if not tool_json_data:
+                return {
+                    "status": "error",
+                    "error": "No data found in SSE response",
+                }
+
+            tool_result = _json.loads(tool_json_data)
 
+            # Check for JSON-RPC error
+            if "error" in tool_result:
                 return {
-                    "status": "ok",
-                    "app_id": app_id,
-                    "app_name": app.card.name,
-                    "tool_name": tool_name,
-                    "result": content_items,
-                    "is_error": result_data.get("isError", False),
+                    "status": "error",
+                    "error": tool_result["error"].get("message", "Unknown error"),
                 }
 
+            result_data = tool_result.get("result", {})
+            content_items = []
+
+            # Process content from result
+            for content in result_data.get("content", ()):
+                content_type = content.get("type", "unknown")
+                if content_type == "text":
+                    content_items.append(
+                        {"type": "text", "text": content.get("text", "")}
+                    )
+                elif content_type == "image":
+                    content_items.append(
+                        {"type": "image", "data": content.get("data", "")}
+                    )
+                else:
+                    content_items.append({"type": content_type, "raw": str(content)})
+
+            return {
+                "status": "ok",
+                "app_id": app_id,
+                "app_name": app.card.name,
+                "tool_name": tool_name,
+                "result": content_items,
+                "is_error": result_data.get("isError", False),
+            }
+
     except Exception as e:
         logger.error(f"Failed to execute tool {tool_name} on app {app_id}: {e}")
         return {
@@ -875,6 +1139,73 @@ async def app__execute(
         }
 
 
+async def _call_execute_tool(
+    client: httpx.AsyncClient, mcp_endpoint: str, tool_request: dict, headers: dict
+) -> tuple[int, bytes | None]:
+    """Call tools/call on an App and stream its reply up to the first event.
+
+    Large tool outputs (e.g. base64 images) are consumed chunk by chunk
+    instead of being buffered and decoded as one string.
+
+    Returns:
+        Tuple of (HTTP status code, JSON-RPC payload from the first SSE event).
+    """
+    async with client.stream(
+        "POST", mcp_endpoint, json=tool_request, headers=headers
+    ) as response:
+        if response.status_code != 200:
+            return response.status_code, None
+        return response.status_code, await read_first_sse_data(response)
+
+
+async def _initialize_execute_session(
+    client: httpx.AsyncClient, mcp_endpoint: str, headers: dict
+) -> tuple[str | None, str | None]:
+    """Open a new MCP session on an App for app__execute.
+
+    Returns:
+        Tuple of (session ID, error message); exactly one is set.
+    """
+    response = await client.post(
+        mcp_endpoint, json=_EXECUTE_INIT_REQUEST, headers=headers
+    )
+    if response.status_code != 200:
+        return None, f"Failed to initialize MCP session: {response.status_code}"
+
+    session_id = response.headers.get("mcp-session-id") or response.headers.get(
+        "x-session-id"
+    )
+    if not session_id:
+        return None, "No session ID found in MCP response"
+    return session_id, None
+
+
+async def _get_execute_session(
+    client: httpx.AsyncClient, key: tuple[str, str], mcp_endpoint: str, headers: dict
+) -> tuple[str | None, bool, str | None]:
+    """Get the cached app__execute session for ``key`` or open a new one.
+
+    Returns:
+        Tuple of (session ID, whether it came from the cache, error message).
+    """
+    cached = _execute_sessions.get(key)
+    if cached and time.monotonic() - cached[0] < _EXECUTE_SESSION_TTL:
+        return cached[1], True, None
+
+    session_id, error = await _initialize_execute_session(client, mcp_endpoint, headers)
+    if session_id:
+        _cache_execute_session(key, session_id)
+    return session_id, False, error
+
+
+def _cache_execute_session(key: tuple[str, str], session_id: str) -> None:
+    """Cache an app__execute session ID, evicting the oldest when full."""
+    _execute_sessions.pop(key, None)
+    if len(_execute_sessions) >= _EXECUTE_SESSION_MAXSIZE:
+        del _execute_sessions[next(iter(_execute_sessions))]
+    _execute_sessions[key] = (time.monotonic(), session_id)
+
+
 def _extract_agent_context(ctx: Context) -> dict:
     """Extract agent context from MCP request for passing to Apps.
 
@@ -901,27 +1232,15 @@ def _extract_agent_context(ctx: Context) -> dict:
     if agent_id:
         context["agent_id"] = agent_id
 
-    # Extract ALL HTTP headers
+    # Extract ALL HTTP headers (shared with the agent_id lookup above)
     try:
-        from fastmcp.server.dependencies import get_http_headers
-
-        headers = get_http_headers()
-        if headers:
-            # Pass through ALL headers (convert to dict if needed)
-            context["headers"] = dict(headers) if hasattr(headers, "items") else headers
+        context["headers"] = _request_headers(_request_memo(ctx))
     except Exception:
         pass
 
     # Extract metadata from MCP request context
     try:
-        if ctx.request_context and ctx.request_context.meta:
-            meta = ctx.request_context.meta
-            if hasattr(meta, "items"):
-                context["metadata"] = dict(meta)
-            elif hasattr(meta, "__dict__"):
-                context["metadata"] = {
-                    k: v for k, v in meta.__dict__.items() if not k.startswith("_")
-                }
+        context["metadata"] = _request_metadata(ctx, _request_memo(ctx))
     except Exception:
         pass
 
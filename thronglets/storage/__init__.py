@@ -1,5 +1,7 @@
 """Storage layer for Thronglets ServiceBus."""
 
+from collections.abc import Callable
+
 from thronglets.storage.base import Storage, StorageConfig
 from thronglets.storage.memory import MemoryStorage, MemoryStorageConfig
 from thronglets.storage.redis import RedisStorage, RedisStorageConfig
@@ -14,6 +16,12 @@ __all__ = [
     "create_storage",
 ]
 
+# Backend constructor per config class
+_STORAGE_REGISTRY: dict[type[StorageConfig], Callable[..., Storage]] = {
+    MemoryStorageConfig: MemoryStorage,
+    RedisStorageConfig: RedisStorage,
+}
+
 
 def create_storage(config: StorageConfig) -> Storage:
     """Create a storage instance from configuration.
@@ -31,9 +39,17 @@ def create_storage(config: StorageConfig) -> Storage:
         >>> config = RedisStorageConfig(url="redis://localhost:6379")
         >>> storage = create_storage(config)
     """
-    if isinstance(config, MemoryStorageConfig):
-        return MemoryStorage(config)
-    elif isinstance(config, RedisStorageConfig):
-        return RedisStorage(config)
-    else:
-        raise ValueError(f"Unknown storage config type: {type(config)}")
+    factory = _STORAGE_REGISTRY.get(type(config))
+    if factory is None:
+        # Subclassed configs resolve to their nearest registered base
+        factory = next(
+            (
+                _STORAGE_REGISTRY[cls]
+                for cls in type(config).__mro__
+                if cls in _STORAGE_REGISTRY
+            ),
+            None,
+        )
+        if factory is None:
+            raise ValueError(f"Unknown storage config type: {type(config)}")
+    return factory(config)
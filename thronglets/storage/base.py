@@ -1,12 +1,14 @@
 """Abstract base class for storage backends."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
 from typing import Any
 
 from pydantic import BaseModel
 
 from thronglets.models import (
     InternalMessage,
+    Message,
     RegisteredAgent,
     RegisteredApp,
     Task,
@@ -27,6 +29,11 @@ class Storage(ABC):
     the required methods for agents, tasks, and messages.
     """
 
+    __slots__ = ("config",)
+
+    # Whether calls do blocking network I/O that should stay off the event loop
+    blocking_io: bool = False
+
     def __init__(self, config: StorageConfig) -> None:
         """Initialize storage with configuration."""
         self.config = config
@@ -83,6 +90,16 @@ class Storage(ABC):
         """
         pass
 
+    def count_agents(self) -> int:
+        """Count registered agents.
+
+        Backends that can count without loading records should override this.
+
+        Returns:
+            Number of registered agents.
+        """
+        return len(self.list_agents())
+
     @abstractmethod
     def delete_agent(self, agent_id: str) -> bool:
         """Delete an agent.
@@ -109,6 +126,79 @@ class Storage(ABC):
                 return agent
         return None
 
+    def get_agents(self, agent_ids: list[str]) -> dict[str, RegisteredAgent]:
+        """Get several agents by ID in one call.
+
+        Backends that can batch lookups should override this loop.
+
+        Args:
+            agent_ids: The agent IDs to look up.
+
+        Returns:
+            Mapping of agent ID to agent for the IDs that exist.
+        """
+        agents = {}
+        for agent_id in agent_ids:
+            agent = self.get_agent(agent_id)
+            if agent:
+                agents[agent_id] = agent
+        return agents
+
+    def find_agent_by_name_version(
+        self, name: str, version: str
+    ) -> RegisteredAgent | None:
+        """Find an agent by its card's name and version.
+
+        Backends that keep an index should override this linear scan.
+
+        Args:
+            name: The agent's name.
+            version: The agent's version.
+
+        Returns:
+            The agent if found, None otherwise.
+        """
+        for agent in self.list_agents():
+            if agent.card.name == name and agent.card.version == version:
+                return agent
+        return None
+
+    def touch_agent(self, agent_id: str) -> RegisteredAgent | None:
+        """Update an agent's last_seen_at timestamp and renew its TTL.
+
+        Args:
+            agent_id: The agent's unique identifier.
+
+        Returns:
+            The agent if found, None otherwise.
+        """
+        agent = self.get_agent(agent_id)
+        if not agent:
+            return None
+        agent.last_seen_at = datetime.now()
+        return self.register_agent(agent)
+
+    def cleanup_expired_agents(self, max_age_seconds: float) -> list[str]:
+        """Remove agents that haven't been seen within the threshold.
+
+        Backends that index agents by last_seen_at should override this scan.
+
+        Args:
+            max_age_seconds: Maximum time since an agent's last_seen_at.
+
+        Returns:
+            The IDs of the removed agents.
+        """
+        cutoff = datetime.now() - timedelta(seconds=max_age_seconds)
+        expired = [
+            agent.agent_id
+            for agent in self.list_agents()
+            if agent.last_seen_at < cutoff
+        ]
+        for agent_id in expired:
+            self.delete_agent(agent_id)
+        return expired
+
     # ============ Task Operations ============
 
     @abstractmethod
@@ -142,17 +232,34 @@ class Storage(ABC):
         status: TaskState | None = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> tuple[list[Task], int]:
-        """List tasks with optional filtering.
+        after: tuple[float, str] | None = None,
+    ) -> tuple[list[Task], int, list[tuple[float, str]]]:
+        """List tasks with optional filtering, oldest first.
 
         Args:
             context_id: Filter by context ID.
             status: Filter by task state.
             limit: Maximum number of tasks to return.
             offset: Number of tasks to skip.
+            after: Only return tasks created after this cursor, as returned
+                alongside an earlier page or by ``task_cursor``. The cursor
+                stays valid after its task is deleted.
 
         Returns:
-            Tuple of (tasks list, total count).
+            Tuple of (tasks list, total count, cursors), where ``cursors[i]``
+            resumes listing right after ``tasks[i]``.
+        """
+        pass
+
+    @abstractmethod
+    def task_cursor(self, task_id: str) -> tuple[float, str] | None:
+        """Get a task's creation-order position for resuming ``list_tasks``.
+
+        Args:
+            task_id: The task's unique identifier.
+
+        Returns:
+            A (position, task_id) cursor, or None if the task is unknown.
         """
         pass
 
@@ -180,6 +287,30 @@ class Storage(ABC):
         """
         pass
 
+    def append_task_history(
+        self, task_id: str, messages: list[Message], max_length: int = 0
+    ) -> Task | None:
+        """Append messages to a task's history.
+
+        Backends that can append without a full task rewrite should override
+        this read-modify-write.
+
+        Args:
+            task_id: The task's unique identifier.
+            messages: The messages to append, oldest first.
+            max_length: Most recent messages to keep (0 keeps all).
+
+        Returns:
+            The updated task if found, None otherwise.
+        """
+        task = self.get_task(task_id)
+        if not task:
+            return None
+        task.history.extend(messages)
+        if max_length and len(task.history) > max_length:
+            del task.history[:-max_length]
+        return self.update_task(task)
+
     @abstractmethod
     def cancel_task(self, task_id: str) -> Task | None:
         """Cancel a task.
@@ -206,6 +337,21 @@ class Storage(ABC):
         """
         pass
 
+    def send_messages(self, messages: list[InternalMessage]) -> list[InternalMessage]:
+        """Send several messages in one call.
+
+        Backends that can batch writes should override this loop.
+
+        Args:
+            messages: The messages to send.
+
+        Returns:
+            The sent messages.
+        """
+        for message in messages:
+            self.send_message(message)
+        return messages
+
     @abstractmethod
     def receive_messages(
         self,
@@ -263,6 +409,24 @@ class Storage(ABC):
         """
         pass
 
+    def get_apps(self, app_ids: list[str]) -> dict[str, RegisteredApp]:
+        """Get several apps by ID in one call.
+
+        Backends that can batch lookups should override this loop.
+
+        Args:
+            app_ids: The app IDs to look up.
+
+        Returns:
+            Mapping of app ID to app for the IDs that exist.
+        """
+        apps = {}
+        for app_id in app_ids:
+            app = self.get_app(app_id)
+            if app:
+                apps[app_id] = app
+        return apps
+
     @abstractmethod
     def list_apps(self, healthy_only: bool = True) -> list[RegisteredApp]:
         """List all registered apps.
@@ -287,6 +451,19 @@ class Storage(ABC):
         """
         pass
 
+    def bulk_update_apps(self, apps: list[RegisteredApp]) -> None:
+        """Update several existing apps at once.
+
+        Apps that are no longer registered are skipped rather than recreated.
+        Backends should override this to batch the writes.
+
+        Args:
+            apps: The apps with updated data.
+        """
+        for app in apps:
+            if self.get_app(app.app_id):
+                self.update_app(app)
+
     @abstractmethod
     def delete_app(self, app_id: str) -> bool:
         """Delete an app.
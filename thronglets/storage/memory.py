@@ -1,14 +1,19 @@
 """In-memory storage implementation."""
 
-from collections import defaultdict
+import bisect
+import itertools
+from collections import defaultdict, deque
 from datetime import datetime
 
 from thronglets.models import (
+    TERMINAL_TASK_STATES,
     InternalMessage,
+    Message,
     RegisteredAgent,
     RegisteredApp,
     Task,
     TaskState,
+    TaskStatus,
 )
 from thronglets.storage.base import Storage, StorageConfig
 
@@ -24,15 +29,63 @@ class MemoryStorage(Storage):
 
     This storage keeps all data in memory and is lost when the process exits.
     Suitable for development and testing.
+
+    It is not thread-safe: every method is expected to run on the event
+    loop thread, which already serializes access without locking.
     """
 
+    __slots__ = (
+        "_agents",
+        "_agent_ids_by_name_version",
+        "_agent_ids_by_name",
+        "_agent_names",
+        "_app_ids_by_name",
+        "_app_names",
+        "_tasks",
+        "_task_order",
+        "_task_seqs",
+        "_next_task_seq",
+        "_task_order_by_state",
+        "_task_order_by_context",
+        "_task_keys",
+        "_messages",
+        "_unread",
+        "_apps",
+        "_agents_snapshot",
+        "_apps_snapshot",
+        "_connected",
+    )
+
     def __init__(self, config: MemoryStorageConfig | None = None) -> None:
         """Initialize in-memory storage."""
         super().__init__(config or MemoryStorageConfig())
         self._agents: dict[str, RegisteredAgent] = {}
+        self._agent_ids_by_name_version: dict[tuple[str, str], str] = {}
+        # Name -> IDs in registration order, so find_*_by_name skips the scan,
+        # plus ID -> indexed name since cards may be replaced in place
+        self._agent_ids_by_name: dict[str, dict[str, None]] = {}
+        self._agent_names: dict[str, str] = {}
+        self._app_ids_by_name: dict[str, dict[str, None]] = {}
+        self._app_names: dict[str, str] = {}
         self._tasks: dict[str, Task] = {}
-        self._messages: dict[str, list[InternalMessage]] = defaultdict(list)
+        # Creation order as sorted (seq, task_id) so cursors resume by bisect
+        self._task_order: list[tuple[int, str]] = []
+        self._task_seqs: dict[str, int] = {}
+        self._next_task_seq = itertools.count()
+        # Creation order per state and per context, also sorted (seq, task_id),
+        # so filtered pages are a bisect and a slice; plus the
+        # (state, context_id) each task is filed under
+        self._task_order_by_state: dict[TaskState, list[tuple[int, str]]] = {}
+        self._task_order_by_context: dict[str, list[tuple[int, str]]] = {}
+        self._task_keys: dict[str, tuple[TaskState, str]] = {}
+        # Full mailbox per agent; deques grow without large resize copies
+        self._messages: dict[str, deque[InternalMessage]] = defaultdict(deque)
+        # Unread messages per agent, oldest first, so receiving is O(limit)
+        self._unread: dict[str, deque[InternalMessage]] = defaultdict(deque)
         self._apps: dict[str, RegisteredApp] = {}
+        # Snapshots of the registries for list_*, dropped on every write
+        self._agents_snapshot: tuple[RegisteredAgent, ...] | None = None
+        self._apps_snapshot: tuple[RegisteredApp, ...] | None = None
         self._connected = False
 
     # ============ Lifecycle ============
@@ -54,28 +107,105 @@ class MemoryStorage(Storage):
     def register_agent(self, agent: RegisteredAgent) -> RegisteredAgent:
         """Register a new agent."""
         self._agents[agent.agent_id] = agent
+        self._agents_snapshot = None
+        _reindex_name(
+            self._agent_ids_by_name, self._agent_names, agent.agent_id, agent.card.name
+        )
+        self._agent_ids_by_name_version[(agent.card.name, agent.card.version)] = (
+            agent.agent_id
+        )
         return agent
 
     def get_agent(self, agent_id: str) -> RegisteredAgent | None:
         """Get an agent by ID."""
         return self._agents.get(agent_id)
 
+    def get_agents(self, agent_ids: list[str]) -> dict[str, RegisteredAgent]:
+        """Get several agents by ID with a single dict comprehension."""
+        agents = self._agents
+        return {
+            agent_id: agents[agent_id] for agent_id in agent_ids if agent_id in agents
+        }
+
     def list_agents(self) -> list[RegisteredAgent]:
         """List all registered agents."""
-        return list(self._agents.values())
+        if self._agents_snapshot is None:
+            self._agents_snapshot = tuple(self._agents.values())
+        return list(self._agents_snapshot)
+
+    def count_agents(self) -> int:
+        """Count registered agents."""
+        return len(self._agents)
 
     def delete_agent(self, agent_id: str) -> bool:
         """Delete an agent."""
-        if agent_id in self._agents:
-            del self._agents[agent_id]
-            return True
-        return False
+        agent = self._agents.pop(agent_id, None)
+        if agent is None:
+            return False
+        self._agents_snapshot = None
+        _reindex_name(self._agent_ids_by_name, self._agent_names, agent_id, None)
+        key = (agent.card.name, agent.card.version)
+        if self._agent_ids_by_name_version.get(key) == agent_id:
+            del self._agent_ids_by_name_version[key]
+        return True
+
+    def find_agent_by_name(self, name: str) -> RegisteredAgent | None:
+        """Find the earliest registered agent with a name via the name index."""
+        agent_ids = self._agent_ids_by_name.get(name)
+        return self._agents[next(iter(agent_ids))] if agent_ids else None
+
+    def find_agent_by_name_version(
+        self, name: str, version: str
+    ) -> RegisteredAgent | None:
+        """Find an agent by name and version via the in-memory index."""
+        agent_id = self._agent_ids_by_name_version.get((name, version))
+        return self._agents.get(agent_id) if agent_id else None
+
+    def touch_agent(self, agent_id: str) -> RegisteredAgent | None:
+        """Update an agent's last_seen_at timestamp."""
+        agent = self._agents.get(agent_id)
+        if agent:
+            agent.last_seen_at = datetime.now()
+        return agent
 
     # ============ Task Operations ============
 
+    def _track_task(self, task: Task) -> None:
+        """Index a stored task, appending it to the creation order if new."""
+        task_id = task.id
+        if task_id not in self._task_seqs:
+            seq = next(self._next_task_seq)
+            self._task_seqs[task_id] = seq
+            self._task_order.append((seq, task_id))
+
+        key = (task.status.state, task.context_id)
+        old_key = self._task_keys.get(task_id)
+        if old_key == key:
+            return
+        entry = (self._task_seqs[task_id], task_id)
+        if old_key is not None:
+            self._unindex_task_filters(entry, old_key)
+        self._task_keys[task_id] = key
+        bisect.insort(self._task_order_by_state.setdefault(key[0], []), entry)
+        bisect.insort(self._task_order_by_context.setdefault(key[1], []), entry)
+
+    def _unindex_task_filters(
+        self, entry: tuple[int, str], key: tuple[TaskState, str]
+    ) -> None:
+        """Remove a (seq, task_id) entry from the state and context indexes."""
+        for index, value in (
+            (self._task_order_by_state, key[0]),
+            (self._task_order_by_context, key[1]),
+        ):
+            order = index[value]
+            del order[bisect.bisect_left(order, entry)]
+            if not order:
+                del index[value]
+
     def create_task(self, task: Task) -> Task:
         """Create a new task."""
         self._tasks[task.id] = task
+        self._track_task(task)
         return task
 
     def get_task(self, task_id: str) -> Task | None:
@@ -88,29 +218,66 @@ class MemoryStorage(Storage):
         status: TaskState | None = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> tuple[list[Task], int]:
-        """List tasks with optional filtering."""
-        tasks = list(self._tasks.values())
-
-        if context_id:
-            tasks = [t for t in tasks if t.context_id == context_id]
-
-        if status:
-            tasks = [t for t in tasks if t.status.state == status]
-
-        total = len(tasks)
-        tasks = tasks[offset : offset + limit]
-        return tasks, total
+        after: tuple[float, str] | None = None,
+    ) -> tuple[list[Task], int, list[tuple[float, str]]]:
+        """List tasks with optional filtering, oldest first."""
+        if context_id or status:
+            by_state = self._task_order_by_state.get(status, []) if status else None
+            by_context = (
+                self._task_order_by_context.get(context_id, []) if context_id else None
+            )
+            if by_state is not None and by_context is not None:
+                # Walk the smaller bucket, checking the other filter per entry
+                if len(by_state) <= len(by_context):
+                    order, field, wanted = by_state, 1, context_id
+                else:
+                    order, field, wanted = by_context, 0, status
+                keys = self._task_keys
+                order = [entry for entry in order if keys[entry[1]][field] == wanted]
+            else:
+                order = by_state if by_state is not None else by_context
+            total = len(order)
+        else:
+            order = self._task_order
+            total = len(self._tasks)
+
+        # Pages are a straight slice of the creation order; list slicing jumps
+        # to the offset, where islice would step through it. The cursor is a
+        # (seq, task_id) position, so it still resolves once its task is gone.
+        start = bisect.bisect_right(order, after) if after is not None else 0
+        page = order[start + offset : start + offset + limit]
+        return [self._tasks[task_id] for _, task_id in page], total, page
+
+    def task_cursor(self, task_id: str) -> tuple[float, str] | None:
+        """Get a task's (seq, task_id) creation-order cursor."""
+        seq = self._task_seqs.get(task_id)
+        return None if seq is None else (seq, task_id)
 
     def update_task(self, task: Task) -> Task:
         """Update an existing task."""
         self._tasks[task.id] = task
+        self._track_task(task)
+        return task
+
+    def append_task_history(
+        self, task_id: str, messages: list[Message], max_length: int = 0
+    ) -> Task | None:
+        """Append messages to a stored task's history in place."""
+        task = self._tasks.get(task_id)
+        if task:
+            task.history.extend(messages)
+            if max_length and len(task.history) > max_length:
+                del task.history[:-max_length]
         return task
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task."""
         if task_id in self._tasks:
             del self._tasks[task_id]
+            seq = self._task_seqs.pop(task_id)
+            index = bisect.bisect_left(self._task_order, (seq, task_id))
+            del self._task_order[index]
+            self._unindex_task_filters((seq, task_id), self._task_keys.pop(task_id))
             return True
         return False
 
@@ -120,17 +287,15 @@ class MemoryStorage(Storage):
         if not task:
             return None
 
-        terminal_states = {
-            TaskState.COMPLETED,
-            TaskState.FAILED,
-            TaskState.CANCELLED,
-            TaskState.REJECTED,
-        }
-        if task.status.state in terminal_states:
+        if task.status.state in TERMINAL_TASK_STATES:
             return task
 
-        task.status.state = TaskState.CANCELLED
-        task.status.timestamp = datetime.now()
+        task.status = TaskStatus.model_construct(
+            state=TaskState.CANCELLED,
+            message=task.status.message,
+            timestamp=datetime.now(),
+        )
+        self._track_task(task)
         return task
 
     # ============ Message Operations ============
@@ -138,8 +303,21 @@ class MemoryStorage(Storage):
     def send_message(self, message: InternalMessage) -> InternalMessage:
         """Send a message to an agent."""
         self._messages[message.to_agent_id].append(message)
+        if not message.read:
+            self._unread[message.to_agent_id].append(message)
         return message
 
+    def send_messages(self, messages: list[InternalMessage]) -> list[InternalMessage]:
+        """Send several messages, extending each recipient's mailbox once."""
+        by_agent: dict[str, list[InternalMessage]] = {}
+        for message in messages:
+            by_agent.setdefault(message.to_agent_id, []).append(message)
+
+        for agent_id, batch in by_agent.items():
+            self._messages[agent_id].extend(batch)
+            self._unread[agent_id].extend(m for m in batch if not m.read)
+        return messages
+
     def receive_messages(
         self,
         agent_id: str,
@@ -147,45 +325,100 @@ class MemoryStorage(Storage):
         limit: int = 100,
     ) -> list[InternalMessage]:
         """Receive messages for an agent."""
-        messages = self._messages.get(agent_id, [])
-        unread = [m for m in messages if not m.read][:limit]
-
-        if mark_as_read:
-            for m in unread:
+        unread = self._unread.get(agent_id)
+        if not unread:
+            return []
+
+        # Entries may have been marked read elsewhere; those are skipped
+        if not mark_as_read:
+            return list(itertools.islice((m for m in unread if not m.read), limit))
+
+        received = []
+        while unread and len(received) < limit:
+            m = unread.popleft()
+            if not m.read:
                 m.read = True
-
-        return unread
+                received.append(m)
+        return received
 
     def get_all_messages(self, agent_id: str) -> list[InternalMessage]:
         """Get all messages for an agent."""
-        return self._messages.get(agent_id, [])
+        return list(self._messages.get(agent_id, ()))
 
     # ============ App Operations ============
 
     def register_app(self, app: RegisteredApp) -> RegisteredApp:
         """Register a new app."""
-        self._apps[app.app_id] = app
+        self._store_app(app)
         return app
 
     def get_app(self, app_id: str) -> RegisteredApp | None:
         """Get an app by ID."""
         return self._apps.get(app_id)
 
+    def get_apps(self, app_ids: list[str]) -> dict[str, RegisteredApp]:
+        """Get several apps by ID with a single dict comprehension."""
+        apps = self._apps
+        return {app_id: apps[app_id] for app_id in app_ids if app_id in apps}
+
+    def find_app_by_name(self, name: str) -> RegisteredApp | None:
+        """Find the earliest registered app with a name via the name index."""
+        app_ids = self._app_ids_by_name.get(name)
+        return self._apps[next(iter(app_ids))] if app_ids else None
+
     def list_apps(self, healthy_only: bool = True) -> list[RegisteredApp]:
         """List all registered apps."""
-        apps = list(self._apps.values())
+        if self._apps_snapshot is None:
+            self._apps_snapshot = tuple(self._apps.values())
+        # Health flips in place, so the filter runs on every call
         if healthy_only:
-            apps = [a for a in apps if a.healthy]
-        return apps
+            return [a for a in self._apps_snapshot if a.healthy]
+        return list(self._apps_snapshot)
 
     def update_app(self, app: RegisteredApp) -> RegisteredApp:
         """Update an existing app."""
-        self._apps[app.app_id] = app
+        self._store_app(app)
         return app
 
+    def bulk_update_apps(self, apps: list[RegisteredApp]) -> None:
+        """Update several existing apps at once."""
+        for app in apps:
+            if app.app_id in self._apps:
+                self._store_app(app)
+
     def delete_app(self, app_id: str) -> bool:
         """Delete an app."""
-        if app_id in self._apps:
-            del self._apps[app_id]
-            return True
-        return False
+        app = self._apps.pop(app_id, None)
+        if app is None:
+            return False
+        self._apps_snapshot = None
+        _reindex_name(self._app_ids_by_name, self._app_names, app_id, None)
+        return True
+
+    def _store_app(self, app: RegisteredApp) -> None:
+        """Store an app and keep the name index in step with its card."""
+        self._apps[app.app_id] = app
+        self._apps_snapshot = None
+        _reindex_name(self._app_ids_by_name, self._app_names, app.app_id, app.card.name)
+
+
+def _reindex_name(
+    index: dict[str, dict[str, None]],
+    names: dict[str, str],
+    item_id: str,
+    new_name: str | None,
+) -> None:
+    """Move an ID to the bucket for its current name (None removes it)."""
+    old_name = names.get(item_id)
+    if old_name == new_name:
+        return
+    if old_name is not None:
+        ids = index[old_name]
+        del ids[item_id]
+        if not ids:
+            del index[old_name]
+    if new_name is None:
+        del names[item_id]
+    else:
+        index.setdefault(new_name, {})[item_id] = None
+        names[item_id] = new_name
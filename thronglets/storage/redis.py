@@ -1,20 +1,47 @@
 """Redis storage implementation."""
 
+import bisect
 import json
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
 import redis
 
 from thronglets.models import (
+    TERMINAL_TASK_STATES,
     InternalMessage,
+    Message,
     RegisteredAgent,
     RegisteredApp,
     Task,
     TaskState,
+    TaskStatus,
+    generate_uuid,
 )
 from thronglets.storage.base import Storage, StorageConfig
 
+# Server-side scripts that fetch a set's records in one round trip. Both
+# collect IDs into `ids`, then MGET ARGV[1] .. id in chunks that stay under
+# Lua's unpack() limit.
+_MGET_IDS = """
+local results = {}
+for start = 1, #ids, 1000 do
+    local keys = {}
+    for i = start, math.min(start + 999, #ids) do
+        keys[#keys + 1] = ARGV[1] .. ids[i]
+    end
+    for _, data in ipairs(redis.call('MGET', unpack(keys))) do
+        results[#results + 1] = data
+    end
+end
+return results
+"""
+# Every member of the set KEYS[1]
+_LIST_BY_SET_SCRIPT = "local ids = redis.call('SMEMBERS', KEYS[1])" + _MGET_IDS
+# Atomically pop up to ARGV[2] members of the unread set KEYS[1]
+_POP_UNREAD_SCRIPT = "local ids = redis.call('SPOP', KEYS[1], ARGV[2])" + _MGET_IDS
+
 
 class RedisStorageConfig(StorageConfig):
     """Configuration for Redis storage."""
@@ -32,6 +59,8 @@ class RedisStorageConfig(StorageConfig):
     decode_responses: bool = True
     socket_timeout: float = 5.0
     socket_connect_timeout: float = 5.0
+    max_connections: int = 64  # Callers wait for a free connection beyond this
+    health_check_interval: int = 30  # Ping idle connections before reuse
 
 
 class RedisStorage(Storage):
@@ -41,6 +70,7 @@ class RedisStorage(Storage):
     - Agents:
       - Hash: `{prefix}agent:{id}` - agent data
       - Set: `{prefix}agents` - all agent IDs for listing
+      - Sorted Set: `{prefix}agents:by_last_seen` - agent IDs by last_seen_at
 
     - Tasks:
       - Hash: `{prefix}task:{id}` - task data
@@ -48,6 +78,8 @@ class RedisStorage(Storage):
       - Set: `{prefix}tasks:context:{context_id}` - task IDs by context
       - Set: `{prefix}tasks:status:{status}` - task IDs by status
       - Sorted Set: `{prefix}tasks:by_time` - task IDs sorted by timestamp
+      - Sorted Set: `{prefix}tasks:by_created` - task IDs in creation order
+      - Sorted Set: `{prefix}tasks:page:{uuid}` - short-lived filtered page
 
     - Messages:
       - List: `{prefix}messages:{agent_id}` - message queue (FIFO)
@@ -59,11 +91,21 @@ class RedisStorage(Storage):
       - Set: `{prefix}apps` - all app IDs for listing
     """
 
+    __slots__ = ("_client", "_list_by_set", "_pop_unread", "_status_keys")
+
+    blocking_io = True
+
     def __init__(self, config: RedisStorageConfig | None = None) -> None:
         """Initialize Redis storage."""
         super().__init__(config or RedisStorageConfig())
         self.config: RedisStorageConfig = self.config  # type hint
         self._client: redis.Redis | None = None
+        self._list_by_set = None
+        self._pop_unread = None
+        # Status index keys are touched for every state on each update
+        self._status_keys = {
+            state: self._key("tasks", "status", state.value) for state in TaskState
+        }
 
     @property
     def prefix(self) -> str:
@@ -72,27 +114,42 @@ class RedisStorage(Storage):
 
     def _key(self, *parts: str) -> str:
         """Build a Redis key with prefix."""
-        return self.prefix + ":".join(parts)
+        return self.config.key_prefix + ":".join(parts)
+
+    def _keys(self, kind: str, ids: Iterable[str]) -> list[str]:
+        """Build the record keys of one kind for many IDs."""
+        root = self._key(kind, "")
+        return [root + item_id for item_id in ids]
 
     # ============ Lifecycle ============
 
     def connect(self) -> None:
         """Connect to Redis."""
-        self._client = redis.from_url(
+        pool = redis.BlockingConnectionPool.from_url(
             self.config.url,
             db=self.config.db,
+            max_connections=self.config.max_connections,
             decode_responses=self.config.decode_responses,
             socket_timeout=self.config.socket_timeout,
             socket_connect_timeout=self.config.socket_connect_timeout,
+            socket_keepalive=True,
+            health_check_interval=self.config.health_check_interval,
         )
+        self._client = redis.Redis(connection_pool=pool)
         # Test connection
         self._client.ping()
+        self._list_by_set = self._client.register_script(_LIST_BY_SET_SCRIPT)
+        self._pop_unread = self._client.register_script(_POP_UNREAD_SCRIPT)
 
     def disconnect(self) -> None:
         """Disconnect from Redis."""
         if self._client:
             self._client.close()
+            # A pool passed in explicitly is not closed along with the client
+            self._client.connection_pool.disconnect()
             self._client = None
+            self._list_by_set = None
+            self._pop_unread = None
 
     def is_connected(self) -> bool:
         """Check if connected to Redis."""
@@ -111,12 +168,24 @@ class RedisStorage(Storage):
             raise RuntimeError("Redis storage not connected. Call connect() first.")
         return self._client
 
+    def _list_records(self, set_key: str, kind: str) -> list:
+        """Fetch the raw records of every ID in a set in one round trip."""
+        if self._list_by_set is None:
+            raise RuntimeError("Redis storage not connected. Call connect() first.")
+        return self._list_by_set(keys=[set_key], args=[self._key(kind, "")])
+
     # ============ Serialization ============
 
     def _serialize(self, obj: Any) -> str:
-        """Serialize an object to JSON string."""
-        if hasattr(obj, "model_dump"):
-            return json.dumps(obj.model_dump(), default=str)
+        """Serialize an object to JSON string.
+
+        Models are encoded by pydantic-core directly, without building an
+        intermediate dict. Unset optional fields are dropped (they default
+        back to None on load), which keeps text-only message parts from
+        storing three nulls each.
+        """
+        if hasattr(obj, "model_dump_json"):
+            return obj.model_dump_json(exclude_none=True)
         return json.dumps(obj, default=str)
 
     def _deserialize_agent(self, data: str | None) -> RegisteredAgent | None:
@@ -150,18 +219,22 @@ class RedisStorage(Storage):
         agent_key = self._key("agent", agent.agent_id)
         agents_set_key = self._key("agents")
 
-        # Check if agent already exists
-        existing_data = self.client.get(agent_key)
-        if existing_data:
-            # This is a renewal - update last_seen_at and TTL only
-            agent.last_seen_at = datetime.now()
+        # Registering is also how agents renew, so always stamp last_seen_at
+        # rather than spending a round trip to check for an existing key
+        agent.last_seen_at = datetime.now()
 
         pipe = self.client.pipeline()
-        pipe.set(agent_key, self._serialize(agent))
+        pipe.set(agent_key, self._serialize(agent), ex=self.config.agent_ttl or None)
         pipe.sadd(agents_set_key, agent.agent_id)
-
-        if self.config.agent_ttl:
-            pipe.expire(agent_key, self.config.agent_ttl)
+        pipe.zadd(
+            self._key("agents", "by_last_seen"),
+            {agent.agent_id: agent.last_seen_at.timestamp()},
+        )
+        pipe.hset(
+            self._key("agents", "by_name_version"),
+            self._name_version_field(agent.card.name, agent.card.version),
+            agent.agent_id,
+        )
 
         pipe.execute()
         return agent
@@ -174,26 +247,26 @@ class RedisStorage(Storage):
 
     def list_agents(self) -> list[RegisteredAgent]:
         """List all registered agents."""
-        agents_set_key = self._key("agents")
-        agent_ids = self.client.smembers(agents_set_key)
-
-        if not agent_ids:
-            return []
-
-        # Use pipeline to fetch all agents efficiently
-        pipe = self.client.pipeline()
-        for agent_id in agent_ids:
-            pipe.get(self._key("agent", agent_id))
-
-        results = pipe.execute()
         agents = []
-        for data in results:
+        for data in self._list_records(self._key("agents"), "agent"):
             agent = self._deserialize_agent(data)
             if agent:
                 agents.append(agent)
 
         return agents
 
+    def count_agents(self) -> int:
+        """Count live agents via the last-seen index.
+
+        Agent records expire by TTL while their IDs stay indexed until
+        cleanup, so only agents seen within ``agent_ttl`` are counted.
+        """
+        last_seen_key = self._key("agents", "by_last_seen")
+        if not self.config.agent_ttl:
+            return self.client.zcard(last_seen_key)
+        cutoff = datetime.now().timestamp() - self.config.agent_ttl
+        return self.client.zcount(last_seen_key, f"({cutoff}", "+inf")
+
     def delete_agent(self, agent_id: str) -> bool:
         """Delete an agent."""
         agent_key = self._key("agent", agent_id)
@@ -202,10 +275,81 @@ class RedisStorage(Storage):
         pipe = self.client.pipeline()
         pipe.delete(agent_key)
         pipe.srem(agents_set_key, agent_id)
+        pipe.zrem(self._key("agents", "by_last_seen"), agent_id)
         results = pipe.execute()
 
         return results[0] > 0  # True if key was deleted
 
+    def cleanup_expired_agents(self, max_age_seconds: float) -> list[str]:
+        """Remove agents not seen within the threshold via the last-seen index."""
+        last_seen_key = self._key("agents", "by_last_seen")
+        cutoff = datetime.now().timestamp() - max_age_seconds
+        expired = self.client.zrangebyscore(last_seen_key, "-inf", f"({cutoff}")
+        if not expired:
+            return []
+
+        pipe = self.client.pipeline()
+        pipe.delete(*self._keys("agent", expired))
+        pipe.srem(self._key("agents"), *expired)
+        pipe.zrem(last_seen_key, *expired)
+        pipe.execute()
+        return list(expired)
+
+    @staticmethod
+    def _name_version_field(name: str, version: str) -> str:
+        """Build the name/version index field for an agent card."""
+        return f"{name}\x00{version}"
+
+    def get_agents(self, agent_ids: list[str]) -> dict[str, RegisteredAgent]:
+        """Get several agents by ID with a single MGET."""
+        if not agent_ids:
+            return {}
+        keys = self._keys("agent", agent_ids)
+        agents = {}
+        for data in self.client.mget(keys):
+            agent = self._deserialize_agent(data)
+            if agent:
+                agents[agent.agent_id] = agent
+        return agents
+
+    def find_agent_by_name_version(
+        self, name: str, version: str
+    ) -> RegisteredAgent | None:
+        """Find an agent by name and version via the name/version index hash.
+
+        Agent keys expire on their own TTL, so a stale index entry is dropped
+        when its agent is gone or no longer matches.
+        """
+        index_key = self._key("agents", "by_name_version")
+        field = self._name_version_field(name, version)
+        agent_id = self.client.hget(index_key, field)
+        if not agent_id:
+            return None
+        agent = self.get_agent(agent_id)
+        if agent and agent.card.name == name and agent.card.version == version:
+            return agent
+        self.client.hdel(index_key, field)
+        return None
+
+    def touch_agent(self, agent_id: str) -> RegisteredAgent | None:
+        """Update agent's last_seen_at timestamp and renew its TTL."""
+        agent_key = self._key("agent", agent_id)
+        agent = self._deserialize_agent(self.client.get(agent_key))
+        if not agent:
+            return None
+
+        agent.last_seen_at = datetime.now()
+        pipe = self.client.pipeline()
+        pipe.set(
+            agent_key, self._serialize(agent), xx=True, ex=self.config.agent_ttl or None
+        )
+        pipe.zadd(
+            self._key("agents", "by_last_seen"),
+            {agent_id: agent.last_seen_at.timestamp()},
+        )
+        pipe.execute()
+        return agent
+
     # ============ Task Operations ============
 
     def _add_task_to_indices(
@@ -214,13 +358,14 @@ class RedisStorage(Storage):
         """Add task to all indices."""
         tasks_set_key = self._key("tasks")
         context_set_key = self._key("tasks", "context", task.context_id)
-        status_set_key = self._key("tasks", "status", task.status.state.value)
+        status_set_key = self._status_keys[task.status.state]
         time_sorted_key = self._key("tasks", "by_time")
 
         pipe.sadd(tasks_set_key, task.id)
         pipe.sadd(context_set_key, task.id)
         pipe.sadd(status_set_key, task.id)
         pipe.zadd(time_sorted_key, {task.id: timestamp})
+        pipe.zadd(self._key("tasks", "by_created"), {task.id: timestamp}, nx=True)
 
     def _remove_task_from_indices(
         self, pipe: redis.client.Pipeline, task: Task
@@ -233,10 +378,11 @@ class RedisStorage(Storage):
         pipe.srem(tasks_set_key, task.id)
         pipe.srem(context_set_key, task.id)
         pipe.zrem(time_sorted_key, task.id)
+        pipe.zrem(self._key("tasks", "by_created"), task.id)
 
         # Remove from all status sets
         for state in TaskState:
-            status_set_key = self._key("tasks", "status", state.value)
+            status_set_key = self._status_keys[state]
             pipe.srem(status_set_key, task.id)
 
     def create_task(self, task: Task) -> Task:
@@ -245,12 +391,9 @@ class RedisStorage(Storage):
         timestamp = task.status.timestamp.timestamp()
 
         pipe = self.client.pipeline()
-        pipe.set(task_key, self._serialize(task))
+        pipe.set(task_key, self._serialize(task), ex=self.config.task_ttl or None)
         self._add_task_to_indices(pipe, task, timestamp)
 
-        if self.config.task_ttl:
-            pipe.expire(task_key, self.config.task_ttl)
-
         pipe.execute()
         return task
 
@@ -260,83 +403,193 @@ class RedisStorage(Storage):
         data = self.client.get(task_key)
         return self._deserialize_task(data)
 
+    def _backfill_created_index(self) -> None:
+        """Add tasks stored before the creation-order index existed.
+
+        Uses their last status timestamp, which is the best creation
+        estimate available for them.
+        """
+        created_key = self._key("tasks", "by_created")
+        missing = self.client.zdiff(
+            [self._key("tasks", "by_time"), created_key], withscores=True
+        )
+        if missing:
+            self.client.zadd(created_key, dict(missing), nx=True)
+
     def list_tasks(
         self,
         context_id: str | None = None,
         status: TaskState | None = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> tuple[list[Task], int]:
-        """List tasks with optional filtering."""
-        # Determine which set to use for filtering
-        if context_id and status:
-            # Intersection of context and status sets
-            context_set_key = self._key("tasks", "context", context_id)
-            status_set_key = self._key("tasks", "status", status.value)
-            task_ids = self.client.sinter(context_set_key, status_set_key)
-        elif context_id:
-            context_set_key = self._key("tasks", "context", context_id)
-            task_ids = self.client.smembers(context_set_key)
-        elif status:
-            status_set_key = self._key("tasks", "status", status.value)
-            task_ids = self.client.smembers(status_set_key)
-        else:
-            tasks_set_key = self._key("tasks")
-            task_ids = self.client.smembers(tasks_set_key)
+        after: tuple[float, str] | None = None,
+    ) -> tuple[list[Task], int, list[tuple[float, str]]]:
+        """List tasks with optional filtering, oldest first.
 
-        if not task_ids:
-            return [], 0
+        Expired task keys leave their IDs behind in the indexes. Any met on
+        a page are pruned and the page is topped back up, so a short page
+        always means there are no more tasks.
+        """
+        # Determine which sets to filter by
+        filter_keys = []
+        if context_id:
+            filter_keys.append(self._key("tasks", "context", context_id))
+        if status:
+            filter_keys.append(self._status_keys[status])
+
+        page, total = self._page_task_ids(filter_keys, limit, offset, after)
+        tasks = []
+        cursors = []
+        wanted = limit
+        while page:
+            task_ids = [task_id for task_id, _ in page]
+            stale = []
+            for (task_id, score), data in zip(
+                page, self.client.mget(self._keys("task", task_ids)), strict=True
+            ):
+                task = self._deserialize_task(data)
+                if task:
+                    tasks.append(task)
+                    cursors.append((score, task_id))
+                else:
+                    stale.append(task_id)
+            if not stale:
+                break
+            self._prune_task_ids(stale)
+            total -= len(stale)
+            if len(page) < wanted:
+                break  # The index ran out before the page filled
+            # Resume right after this page's last ID for the missing tasks
+            wanted = len(stale)
+            last_id, last_score = page[-1]
+            page, _ = self._page_task_ids(filter_keys, wanted, 0, (last_score, last_id))
+
+        return tasks, total, cursors
+
+    def task_cursor(self, task_id: str) -> tuple[float, str] | None:
+        """Get a task's (creation score, task_id) cursor."""
+        score = self.client.zscore(self._key("tasks", "by_created"), task_id)
+        return None if score is None else (score, task_id)
+
+    def _prune_task_ids(self, task_ids: list[str]) -> None:
+        """Drop IDs of expired tasks from the listing indexes.
+
+        Their context is no longer known, so context sets keep the IDs; those
+        drop out when intersected with the creation-order index.
+        """
+        pipe = self.client.pipeline()
+        pipe.srem(self._key("tasks"), *task_ids)
+        pipe.zrem(self._key("tasks", "by_created"), *task_ids)
+        pipe.zrem(self._key("tasks", "by_time"), *task_ids)
+        for status_key in self._status_keys.values():
+            pipe.srem(status_key, *task_ids)
+        pipe.execute()
 
-        total = len(task_ids)
-        task_ids = list(task_ids)[offset : offset + limit]
+    def _page_task_ids(
+        self,
+        filter_keys: list[str],
+        limit: int,
+        offset: int,
+        after: tuple[float, str] | None,
+    ) -> tuple[list[tuple[str, float]], int]:
+        """Page task IDs by creation order as (task_id, score) pairs.
+
+        Unfiltered pages come straight off the creation-order index. Filter
+        sets are intersected with it into a short-lived sorted set on the
+        server, so only the total and the page's IDs cross the network
+        instead of every matching ID.
+        """
+        created_key = self._key("tasks", "by_created")
+        if filter_keys:
+            zset_key = self._key("tasks", "page", generate_uuid())
+            # Set members score 1, so zero weights leave the creation score
+            weights = dict.fromkeys(filter_keys, 0) | {created_key: 1}
+        else:
+            zset_key = created_key
 
-        if not task_ids:
-            return [], total
+        for _ in range(2):
+            pipe = self.client.pipeline()
+            pipe.scard(self._key("tasks"))
+            pipe.zcard(created_key)
+            if filter_keys:
+                pipe.zinterstore(zset_key, weights)
+                pipe.expire(zset_key, 60)  # Dropped below; this covers failures
+            if after is None:
+                pipe.zrange(zset_key, offset, offset + limit - 1, withscores=True)
+                if filter_keys:
+                    pipe.delete(zset_key)
+            else:
+                # Seek by position, so the cursor outlives its task
+                pipe.zcount(zset_key, "-inf", f"({after[0]}")
+                pipe.zrangebyscore(zset_key, after[0], after[0])
+            known, indexed, *rest = pipe.execute()
+            if indexed >= known:
+                break
+            # Tasks missing from the creation index would be skipped, so
+            # index them and page again
+            self._backfill_created_index()
+
+        if filter_keys:
+            total, _, *rest = rest
+        else:
+            total = known
+        if after is None:
+            return rest[0], total
 
-        # Fetch tasks
+        below, ties = rest
+        start = offset + below + bisect.bisect_right(ties, after[1])
         pipe = self.client.pipeline()
-        for task_id in task_ids:
-            pipe.get(self._key("task", task_id))
-
-        results = pipe.execute()
-        tasks = []
-        for data in results:
-            task = self._deserialize_task(data)
-            if task:
-                tasks.append(task)
-
-        return tasks, total
+        pipe.zrange(zset_key, start, start + limit - 1, withscores=True)
+        if filter_keys:
+            pipe.delete(zset_key)
+        return pipe.execute()[0], total
 
     def update_task(self, task: Task) -> Task:
         """Update an existing task."""
         task_key = self._key("task", task.id)
 
-        # Get old task to update indices
-        old_data = self.client.get(task_key)
-        old_task = self._deserialize_task(old_data)
-
         pipe = self.client.pipeline()
 
-        # Remove from old status index if status changed
-        if old_task and old_task.status.state != task.status.state:
-            old_status_key = self._key("tasks", "status", old_task.status.state.value)
-            new_status_key = self._key("tasks", "status", task.status.state.value)
-            pipe.srem(old_status_key, task.id)
-            pipe.sadd(new_status_key, task.id)
+        # Move the task into its current status index. Clearing every other
+        # status set in the same pipeline avoids fetching and decoding the
+        # stored task just to learn its previous state.
+        for state in TaskState:
+            if state is not task.status.state:
+                pipe.srem(self._status_keys[state], task.id)
+        pipe.sadd(self._status_keys[task.status.state], task.id)
 
         # Update task data
-        pipe.set(task_key, self._serialize(task))
+        pipe.set(task_key, self._serialize(task), ex=self.config.task_ttl or None)
 
         # Update timestamp in sorted set
         time_sorted_key = self._key("tasks", "by_time")
         pipe.zadd(time_sorted_key, {task.id: task.status.timestamp.timestamp()})
 
-        if self.config.task_ttl:
-            pipe.expire(task_key, self.config.task_ttl)
-
         pipe.execute()
         return task
 
+    def append_task_history(
+        self, task_id: str, messages: list[Message], max_length: int = 0
+    ) -> Task | None:
+        """Append messages to a task's history.
+
+        The status and time indices are untouched, so this is one GET and
+        one SET instead of update_task's full index refresh.
+        """
+        task_key = self._key("task", task_id)
+        task = self._deserialize_task(self.client.get(task_key))
+        if not task:
+            return None
+
+        task.history.extend(messages)
+        if max_length and len(task.history) > max_length:
+            del task.history[:-max_length]
+
+        self.client.set(
+            task_key, self._serialize(task), ex=self.config.task_ttl or None
+        )
+        return task
+
     def delete_task(self, task_id: str) -> bool:
         """Delete a task."""
         task_key = self._key("task", task_id)
@@ -361,35 +614,29 @@ class RedisStorage(Storage):
         if not task:
             return None
 
-        terminal_states = {
-            TaskState.COMPLETED,
-            TaskState.FAILED,
-            TaskState.CANCELLED,
-            TaskState.REJECTED,
-        }
-        if task.status.state in terminal_states:
+        if task.status.state in TERMINAL_TASK_STATES:
             return task
 
         # Update status
         old_status = task.status.state
-        task.status.state = TaskState.CANCELLED
-        task.status.timestamp = datetime.now()
+        task.status = TaskStatus.model_construct(
+            state=TaskState.CANCELLED,
+            message=task.status.message,
+            timestamp=datetime.now(),
+        )
 
         # Update in Redis
         task_key = self._key("task", task.id)
-        old_status_key = self._key("tasks", "status", old_status.value)
-        new_status_key = self._key("tasks", "status", TaskState.CANCELLED.value)
+        old_status_key = self._status_keys[old_status]
+        new_status_key = self._status_keys[TaskState.CANCELLED]
         time_sorted_key = self._key("tasks", "by_time")
 
         pipe = self.client.pipeline()
-        pipe.set(task_key, self._serialize(task))
+        pipe.set(task_key, self._serialize(task), ex=self.config.task_ttl or None)
         pipe.srem(old_status_key, task.id)
         pipe.sadd(new_status_key, task.id)
         pipe.zadd(time_sorted_key, {task.id: task.status.timestamp.timestamp()})
 
-        if self.config.task_ttl:
-            pipe.expire(task_key, self.config.task_ttl)
-
         pipe.execute()
         return task
 
@@ -407,8 +654,10 @@ class RedisStorage(Storage):
 
         pipe = self.client.pipeline()
 
-        # Store message data
-        pipe.set(message_key, self._serialize(message))
+        # Store message data along with its TTL
+        pipe.set(
+            message_key, self._serialize(message), ex=self.config.message_ttl or None
+        )
 
         # Add to agent's message queue (push to right for FIFO)
         pipe.rpush(queue_key, message.id)
@@ -418,52 +667,75 @@ class RedisStorage(Storage):
 
         # Set TTL
         if self.config.message_ttl:
-            pipe.expire(message_key, self.config.message_ttl)
             pipe.expire(queue_key, self.config.message_ttl)
             pipe.expire(unread_key, self.config.message_ttl)
 
         pipe.execute()
         return message
 
+    def send_messages(self, messages: list[InternalMessage]) -> list[InternalMessage]:
+        """Send several messages in a single pipeline."""
+        if not messages:
+            return messages
+
+        pipe = self.client.pipeline()
+        touched_keys: set[str] = set()
+        for message in messages:
+            message_key = self._key("message", message.id)
+            queue_key = self._key("messages", message.to_agent_id)
+            unread_key = self._key("messages", message.to_agent_id, "unread")
+
+            pipe.set(
+                message_key,
+                self._serialize(message),
+                ex=self.config.message_ttl or None,
+            )
+            pipe.rpush(queue_key, message.id)
+            pipe.sadd(unread_key, message.id)
+            touched_keys.update((queue_key, unread_key))
+
+        # Queue and unread TTLs only need renewing once per recipient
+        if self.config.message_ttl:
+            for key in touched_keys:
+                pipe.expire(key, self.config.message_ttl)
+
+        pipe.execute()
+        return messages
+
     def receive_messages(
         self,
         agent_id: str,
         mark_as_read: bool = True,
         limit: int = 100,
     ) -> list[InternalMessage]:
-        """Receive messages for an agent."""
-        unread_key = self._key("messages", agent_id, "unread")
+        """Receive messages for an agent.
 
-        # Get unread message IDs
-        unread_ids = self.client.smembers(unread_key)
-        if not unread_ids:
+        A message is read once its ID leaves the unread set; stored records
+        are never rewritten. Marking as read pops the IDs and fetches their
+        records in one atomic script call.
+        """
+        if limit <= 0:
             return []
+        unread_key = self._key("messages", agent_id, "unread")
+        prefix = self._key("message", "")
 
-        unread_ids = list(unread_ids)[:limit]
-
-        # Fetch message data
-        pipe = self.client.pipeline()
-        for msg_id in unread_ids:
-            pipe.get(self._key("message", msg_id))
+        if mark_as_read:
+            if self._pop_unread is None:
+                raise RuntimeError("Redis storage not connected. Call connect() first.")
+            results = self._pop_unread(keys=[unread_key], args=[prefix, limit])
+        else:
+            unread_ids = self.client.smembers(unread_key)
+            if not unread_ids:
+                return []
+            keys = self._keys("message", list(unread_ids)[:limit])
+            results = self.client.mget(keys)
 
-        results = pipe.execute()
         messages = []
-        for i, data in enumerate(results):
+        for data in results:
             msg = self._deserialize_message(data)
             if msg:
+                msg.read = mark_as_read
                 messages.append(msg)
-
-        # Mark as read
-        if mark_as_read and messages:
-            pipe = self.client.pipeline()
-            for msg in messages:
-                msg.read = True
-                # Update message in storage
-                pipe.set(self._key("message", msg.id), self._serialize(msg))
-                # Remove from unread set
-                pipe.srem(unread_key, msg.id)
-            pipe.execute()
-
         return messages
 
     def get_all_messages(self, agent_id: str) -> list[InternalMessage]:
@@ -475,16 +747,17 @@ class RedisStorage(Storage):
         if not message_ids:
             return []
 
-        # Fetch message data
+        keys = self._keys("message", message_ids)
         pipe = self.client.pipeline()
-        for msg_id in message_ids:
-            pipe.get(self._key("message", msg_id))
+        pipe.mget(keys)
+        pipe.smembers(self._key("messages", agent_id, "unread"))
+        results, unread_ids = pipe.execute()
 
-        results = pipe.execute()
         messages = []
         for data in results:
             msg = self._deserialize_message(data)
             if msg:
+                msg.read = msg.id not in unread_ids
                 messages.append(msg)
 
         return messages
@@ -497,12 +770,9 @@ class RedisStorage(Storage):
         apps_set_key = self._key("apps")
 
         pipe = self.client.pipeline()
-        pipe.set(app_key, self._serialize(app))
+        pipe.set(app_key, self._serialize(app), ex=self.config.app_ttl or None)
         pipe.sadd(apps_set_key, app.app_id)
 
-        if self.config.app_ttl:
-            pipe.expire(app_key, self.config.app_ttl)
-
         pipe.execute()
         return app
 
@@ -512,22 +782,21 @@ class RedisStorage(Storage):
         data = self.client.get(app_key)
         return self._deserialize_app(data)
 
-    def list_apps(self, healthy_only: bool = True) -> list[RegisteredApp]:
-        """List all registered apps."""
-        apps_set_key = self._key("apps")
-        app_ids = self.client.smembers(apps_set_key)
-
+    def get_apps(self, app_ids: list[str]) -> dict[str, RegisteredApp]:
+        """Get several apps by ID with a single MGET."""
         if not app_ids:
-            return []
-
-        # Use pipeline to fetch all apps efficiently
-        pipe = self.client.pipeline()
-        for app_id in app_ids:
-            pipe.get(self._key("app", app_id))
+            return {}
+        apps = {}
+        for data in self.client.mget(self._keys("app", app_ids)):
+            app = self._deserialize_app(data)
+            if app:
+                apps[app.app_id] = app
+        return apps
 
-        results = pipe.execute()
+    def list_apps(self, healthy_only: bool = True) -> list[RegisteredApp]:
+        """List all registered apps."""
         apps = []
-        for data in results:
+        for data in self._list_records(self._key("apps"), "app"):
             app = self._deserialize_app(data)
             if app:
                 if healthy_only and not app.healthy:
@@ -539,15 +808,24 @@ class RedisStorage(Storage):
     def update_app(self, app: RegisteredApp) -> RegisteredApp:
         """Update an existing app."""
         app_key = self._key("app", app.app_id)
+        self.client.set(app_key, self._serialize(app), ex=self.config.app_ttl or None)
+        return app
 
-        pipe = self.client.pipeline()
-        pipe.set(app_key, self._serialize(app))
+    def bulk_update_apps(self, apps: list[RegisteredApp]) -> None:
+        """Update several existing apps in a single pipeline.
 
-        if self.config.app_ttl:
-            pipe.expire(app_key, self.config.app_ttl)
+        Uses SET XX so apps deleted concurrently are not recreated.
+        """
+        if not apps:
+            return
 
+        pipe = self.client.pipeline()
+        for app in apps:
+            app_key = self._key("app", app.app_id)
+            pipe.set(
+                app_key, self._serialize(app), xx=True, ex=self.config.app_ttl or None
+            )
         pipe.execute()
-        return app
 
     def delete_app(self, app_id: str) -> bool:
         """Delete an app."""
@@ -4,9 +4,12 @@ This module maintains a global storage instance that can be configured
 via environment variables or programmatically.
 """
 
+import asyncio
 import os
+import time
 from typing import TYPE_CHECKING
 
+from thronglets import _json
 from thronglets.storage import (
     MemoryStorage,
     MemoryStorageConfig,
@@ -20,11 +23,32 @@ from thronglets.storage import (
 if TYPE_CHECKING:
     from thronglets.models import (
         InternalMessage,
+        Message,
         RegisteredAgent,
         Task,
         TaskState,
     )
 
+# Seconds an encoded list response may be served before it is rebuilt
+LIST_CACHE_MAX_AGE = 1.0
+
+# Most queued messages the async send pump writes in one storage call
+SEND_BATCH_MAX = 64
+
+# Most recent messages kept in a task's history. Older ones are dropped, not
+# archived, so the limit is opt-in (0, the default, keeps all history)
+TASK_HISTORY_MAX = int(os.getenv("THRONGLETS_TASK_HISTORY_MAX", "0"))
+
+
+def _trim_history(task: "Task") -> "Task":
+    """Return the task, or a copy keeping only the last TASK_HISTORY_MAX messages.
+
+    The caller's task is never modified.
+    """
+    if TASK_HISTORY_MAX and len(task.history) > TASK_HISTORY_MAX:
+        return task.model_copy(update={"history": task.history[-TASK_HISTORY_MAX:]})
+    return task
+
 
 class Store:
     """Store wrapper that delegates to a Storage backend.
@@ -42,6 +66,23 @@ class Store:
         self._storage = storage or self._create_storage_from_env()
         if not self._storage.is_connected():
             self._storage.connect()
+        # Serialized agent list as (monotonic timestamp, bytes), dropped on
+        # every agent write made through this store
+        self._agents_json: tuple[float, bytes] | None = None
+        self._agents_version = 0
+        # Single writer draining send_message_async calls for blocking backends
+        self._send_queue: asyncio.Queue | None = None
+        self._send_pump: asyncio.Task | None = None
+
+    @property
+    def agents_version(self) -> int:
+        """Counter bumped on every agent write made through this store."""
+        return self._agents_version
+
+    def _agents_changed(self) -> None:
+        """Drop cached agent listings after an agent write."""
+        self._agents_json = None
+        self._agents_version += 1
 
     @staticmethod
     def _create_storage_from_env() -> Storage:
@@ -83,42 +124,85 @@ class Store:
         # Create and connect new storage
         self._storage = create_storage(config)
         self._storage.connect()
+        self._agents_changed()
 
     # ============ Agent Operations ============
 
     def register_agent(self, agent: "RegisteredAgent") -> "RegisteredAgent":
         """Register a new agent."""
+        self._agents_changed()
         return self._storage.register_agent(agent)
 
     def get_agent(self, agent_id: str) -> "RegisteredAgent | None":
         """Get an agent by ID."""
         return self._storage.get_agent(agent_id)
 
+    async def get_agent_async(self, agent_id: str) -> "RegisteredAgent | None":
+        """Get an agent by ID without blocking the event loop."""
+        return await self._offload(self._storage.get_agent, agent_id)
+
     def list_agents(self) -> list["RegisteredAgent"]:
         """List all registered agents."""
         return self._storage.list_agents()
 
+    def count_agents(self) -> int:
+        """Count registered agents."""
+        return self._storage.count_agents()
+
+    def list_agents_json(self) -> bytes:
+        """List all registered agents as an encoded ``{"agents", "total"}`` body.
+
+        The encoded list is reused until an agent is written through this
+        store or LIST_CACHE_MAX_AGE elapses, which bounds staleness from
+        backend-side expiry and writes made by other processes.
+        """
+        now = time.monotonic()
+        if self._agents_json and now - self._agents_json[0] < LIST_CACHE_MAX_AGE:
+            return self._agents_json[1]
+        agents = self._storage.list_agents()
+        body = _json.dumps(
+            {
+                "agents": [agent.model_dump(mode="json") for agent in agents],
+                "total": len(agents),
+            }
+        )
+        self._agents_json = (now, body)
+        return body
+
     def delete_agent(self, agent_id: str) -> bool:
         """Delete an agent."""
+        self._agents_changed()
         return self._storage.delete_agent(agent_id)
 
     def find_agent_by_name(self, name: str) -> "RegisteredAgent | None":
         """Find an agent by name."""
         return self._storage.find_agent_by_name(name)
 
+    def get_agents(self, agent_ids: list[str]) -> dict[str, "RegisteredAgent"]:
+        """Get several agents by ID."""
+        return self._storage.get_agents(agent_ids)
+
+    def find_agent_by_name_version(
+        self, name: str, version: str
+    ) -> "RegisteredAgent | None":
+        """Find an agent by name and version."""
+        return self._storage.find_agent_by_name_version(name, version)
+
     def touch_agent(self, agent_id: str) -> "RegisteredAgent | None":
         """Update agent's last_seen_at timestamp."""
+        self._agents_changed()
         return self._storage.touch_agent(agent_id)
 
     def cleanup_expired_agents(self, max_age_seconds: float) -> list[str]:
         """Remove agents that haven't been seen within the threshold."""
+        self._agents_changed()
         return self._storage.cleanup_expired_agents(max_age_seconds)
 
     # ============ Task Operations ============
 
     def create_task(self, task: "Task") -> "Task":
         """Create a new task."""
-        return self._storage.create_task(task)
+        return self._storage.create_task(_trim_history(task))
 
     def get_task(self, task_id: str) -> "Task | None":
         """Get a task by ID."""
@@ -130,18 +214,38 @@ class Store:
         status: "TaskState | None" = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> tuple[list["Task"], int]:
-        """List tasks with optional filtering."""
+        after: tuple[float, str] | None = None,
+    ) -> tuple[list["Task"], int, list[tuple[float, str]]]:
+        """List tasks with optional filtering, oldest first, with their cursors."""
         return self._storage.list_tasks(
             context_id=context_id,
             status=status,
             limit=limit,
             offset=offset,
+            after=after,
         )
 
+    def task_cursor(self, task_id: str) -> tuple[float, str] | None:
+        """Get a task's creation-order cursor for resuming list_tasks."""
+        return self._storage.task_cursor(task_id)
+
     def update_task(self, task: "Task") -> "Task":
         """Update an existing task."""
-        return self._storage.update_task(task)
+        return self._storage.update_task(_trim_history(task))
+
+    def append_task_history(
+        self, task_id: str, messages: list["Message"]
+    ) -> "Task | None":
+        """Append messages to a task's history, keeping TASK_HISTORY_MAX if set."""
+        return self._storage.append_task_history(
+            task_id, messages, max_length=TASK_HISTORY_MAX
+        )
+
+    async def append_task_history_async(
+        self, task_id: str, messages: list["Message"]
+    ) -> "Task | None":
+        """Append messages to a task's history without blocking the event loop."""
+        return await self._offload(self.append_task_history, task_id, messages)
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task."""
@@ -151,12 +255,89 @@ class Store:
         """Cancel a task."""
         return self._storage.cancel_task(task_id)
 
+    async def _offload(self, func, *args):
+        """Run a storage call in a worker thread if the backend blocks on I/O."""
+        if self._storage.blocking_io:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
     # ============ Message Operations ============
 
     def send_message(self, message: "InternalMessage") -> "InternalMessage":
         """Send a message to an agent."""
         return self._storage.send_message(message)
 
+    def send_messages(
+        self, messages: list["InternalMessage"]
+    ) -> list["InternalMessage"]:
+        """Send several messages to agents in one storage call."""
+        return self._storage.send_messages(messages)
+
+    async def send_message_async(self, message: "InternalMessage") -> "InternalMessage":
+        """Send a message without blocking the event loop.
+
+        For backends doing blocking I/O, sends are queued to one writer task
+        that drains them in batches through send_messages in a worker thread.
+        Other backends are written to directly.
+        """
+        if not self._storage.blocking_io:
+            return self._storage.send_message(message)
+
+        loop = asyncio.get_running_loop()
+        if (
+            self._send_pump is None
+            or self._send_pump.done()
+            or self._send_pump.get_loop() is not loop
+        ):
+            self._send_queue = asyncio.Queue()
+            self._send_pump = loop.create_task(self._run_send_pump(self._send_queue))
+
+        future = loop.create_future()
+        self._send_queue.put_nowait((message, future))
+        return await future
+
+    async def close_send_pump(self) -> None:
+        """Stop the async send pump, cancelling sends still waiting on it.
+
+        Call on shutdown; a later send_message_async starts a new pump.
+        """
+        pump, queue = self._send_pump, self._send_queue
+        self._send_pump = self._send_queue = None
+        if pump is None:
+            return
+        pump.cancel()
+        try:
+            await pump
+        except asyncio.CancelledError:
+            pass
+        while not queue.empty():
+            _, future = queue.get_nowait()
+            future.cancel()
+
+    async def _run_send_pump(self, queue: asyncio.Queue) -> None:
+        """Write queued messages in batches of up to SEND_BATCH_MAX."""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < SEND_BATCH_MAX and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                await asyncio.to_thread(
+                    self._storage.send_messages, [message for message, _ in batch]
+                )
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for message, future in batch:
+                    if not future.done():
+                        future.set_result(message)
+
     def receive_messages(
         self,
         agent_id: str,